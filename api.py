@@ -0,0 +1,881 @@
+import functools
+import hashlib
+import logging
+import math
+import os
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+import streamlit as st
+from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from auth import auth_headers
+from codec import ACCEPT_ENCODING_HEADER, ApiAdapter
+from http_cache import (
+    CachedResponse,
+    ConditionalCache,
+    SingleFlight,
+    auth_scope,
+    request_key,
+    validator_headers,
+)
+from metrics import ClientMetrics, FileExporter, serve_metrics
+from resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_group,
+    is_failure,
+    is_retryable,
+    unavailable_response,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+
+# Seconds; pages that upload files pass a longer timeout explicitly.
+DEFAULT_TIMEOUT = float(os.getenv("API_TIMEOUT", "10"))
+
+# Keep-alive connections kept open to the backend, shared by all sessions.
+POOL_SIZE = int(os.getenv("API_POOL_SIZE", "64"))
+
+# Seconds one script run may spend on backend reads (see start_run).
+RERUN_BUDGET = float(os.getenv("API_RERUN_BUDGET", "8"))
+
+# Seconds a prefetched response stays usable (see prefetch).
+PREFETCH_TTL = float(os.getenv("API_PREFETCH_TTL", "30"))
+
+# Threads shared by all sessions for concurrent page loads.
+FANOUT_WORKERS = int(os.getenv("API_FANOUT_WORKERS", "32"))
+
+# Threads shared by all sessions for per-item fallbacks of bulk endpoints
+# (see put_each), kept apart so a large batch cannot starve page loads.
+PUT_EACH_WORKERS = int(os.getenv("API_PUT_EACH_WORKERS", "4"))
+
+# Bounds of the per-user conditional GET cache (ETag / Last-Modified).
+ETAG_CACHE_ENTRIES = int(os.getenv("API_ETAG_CACHE_ENTRIES", "1024"))
+ETAG_CACHE_BYTES = int(os.getenv("API_ETAG_CACHE_MB", "64")) * 1024 * 1024
+
+# Consecutive failures that open an endpoint group's circuit, and seconds
+# before a probe call is let through again.
+BREAKER_FAILURES = int(os.getenv("API_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.getenv("API_BREAKER_RESET", "30"))
+
+# Attempts made for idempotent mutations (see request(idempotent=...)).
+RETRY_POLICY = RetryPolicy(attempts=int(os.getenv("API_RETRY_ATTEMPTS", "3")))
+
+# Seconds an optional endpoint the backend does not have is skipped before
+# it is tried again (see route_missing).
+MISSING_ENDPOINT_TTL = float(os.getenv("API_MISSING_ENDPOINT_TTL", "300"))
+
+# Prometheus text export of client metrics: a file rewritten at most every
+# API_METRICS_INTERVAL seconds, and/or /metrics served on API_METRICS_PORT.
+METRICS_FILE = os.getenv("API_METRICS_FILE")
+METRICS_PORT = os.getenv("API_METRICS_PORT")
+METRICS_INTERVAL = float(os.getenv("API_METRICS_INTERVAL", "15"))
+
+
+# -------------------------------
+# SHARED SESSION
+# -------------------------------
+@st.cache_resource
+def get_session():
+    """
+    Returns the process-wide requests session.
+    Connections are pooled and reused across reruns and user sessions.
+    Responses are compressed in transit when the backend supports it, and
+    their json() uses orjson when it is installed.
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING_HEADER
+
+    # The session is shared between users, so it must never keep cookies.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    adapter = ApiAdapter(
+        pool_connections=4,
+        pool_maxsize=POOL_SIZE,
+        max_retries=0,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_conditional_cache():
+    """
+    Returns the process-wide conditional GET cache.
+    """
+    return ConditionalCache(ETAG_CACHE_ENTRIES, ETAG_CACHE_BYTES)
+
+
+@st.cache_resource
+def get_singleflight():
+    """
+    Returns the process-wide coalescer for identical in-flight GETs.
+    """
+    return SingleFlight()
+
+
+@st.cache_resource
+def get_breaker(group: str):
+    """
+    Returns the process-wide circuit breaker of an endpoint group.
+    """
+    return CircuitBreaker(group, BREAKER_FAILURES, BREAKER_RESET)
+
+
+@st.cache_resource
+def get_metrics():
+    """
+    Returns the process-wide client metrics registry.
+    """
+    metrics = ClientMetrics()
+    _serve_metrics(metrics)
+    return metrics
+
+
+def _serve_metrics(metrics):
+    """
+    Serves metrics on API_METRICS_PORT, if set. A port that cannot be
+    bound (taken by another process, or still held after a module reload)
+    only costs the endpoint: backend calls must not fail because of it.
+    """
+    if not METRICS_PORT:
+        return None
+    try:
+        return serve_metrics(metrics, int(METRICS_PORT))
+    except (OSError, ValueError) as e:
+        logger.warning("Client metrics not served on port %s: %s", METRICS_PORT, e)
+        return None
+
+
+@st.cache_resource
+def get_metrics_file():
+    """
+    Returns the metrics file exporter, or None if API_METRICS_FILE is unset.
+    """
+    if not METRICS_FILE:
+        return None
+    return FileExporter(get_metrics(), METRICS_FILE, METRICS_INTERVAL)
+
+
+def api_url(path: str) -> str:
+    """
+    Builds an absolute backend URL from an API path.
+    """
+    return f"{API_BASE}/{path.lstrip('/')}"
+
+
+# -------------------------------
+# SCRIPT RUNS
+# -------------------------------
+def start_run(page: str, budget: float = None):
+    """
+    Call at the top of every page.
+    Records how many backend calls the previous run made and starts
+    counting this run's calls under page.
+
+    GETs made during the run share a budget of budget seconds
+    (API_RERUN_BUDGET by default): each waits at most for what is left of
+    it, and once it is spent they are answered from the cache or fail
+    with a 504 at once. Mutations are not budgeted.
+    """
+    previous = st.session_state.get("_api_run")
+    if previous is not None:
+        get_metrics().observe_rerun(previous["page"], previous["calls"])
+
+    budget = RERUN_BUDGET if budget is None else budget
+    st.session_state["_api_run"] = {
+        "page": page,
+        "calls": 0,
+        "deadline": time.monotonic() + budget,
+    }
+
+    exporter = get_metrics_file()
+    if exporter is not None:
+        exporter.maybe_write()
+
+
+def current_run():
+    """
+    Returns the metrics of the current script run, or None outside the script thread.
+    """
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    return st.session_state.get("_api_run")
+
+
+def fragment(func):
+    """
+    st.fragment for pages that call start_run.
+    A fragment rerun skips the top of the page, so the first fragment of
+    such a rerun starts a new run (and read budget) under the same page.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = get_script_run_ctx(suppress_warning=True)
+        run = st.session_state.get("_api_run")
+        fragment_ids = getattr(ctx, "fragment_ids_this_run", None)
+
+        if run is not None and fragment_ids and run.get("fragment_ids") is not fragment_ids:
+            start_run(run["page"])
+            st.session_state["_api_run"]["fragment_ids"] = fragment_ids
+        return func(*args, **kwargs)
+
+    return st.fragment(wrapper)
+
+
+def record_call(run, method, path, res, seconds):
+    """
+    Counts one backend call against run and records it in the client metrics.
+    """
+    if run is not None:
+        run["calls"] += 1
+
+    if getattr(res, "prefetched", False):
+        source = "prefetch"
+    elif getattr(res, "over_budget", False):
+        source = "budget"
+    elif getattr(res, "stale", False):
+        source = "stale"
+    elif getattr(res, "from_cache", False):
+        source = "cache"
+    else:
+        source = "network"
+
+    get_metrics().observe_call(
+        run["page"] if run else "unknown",
+        method,
+        path,
+        res.status_code,
+        seconds,
+        len(res.content or b""),
+        source,
+    )
+
+
+def remaining_budget(run):
+    """
+    Returns the seconds left in run's read budget, or None without a run.
+    """
+    if run is None:
+        return None
+    return run["deadline"] - time.monotonic()
+
+
+def budget_timeout(run, timeout: float) -> float:
+    """
+    Caps a read timeout at what is left of run's budget (never below 0).
+    """
+    remaining = remaining_budget(run)
+    if remaining is None:
+        return timeout
+    return max(0.0, min(timeout, remaining))
+
+
+# -------------------------------
+# REQUESTS
+# -------------------------------
+def request(
+    method: str,
+    path: str,
+    *,
+    auth=True,
+    headers=None,
+    timeout=None,
+    share_scope=None,
+    idempotent=None,
+    _run=None,
+    _requested=None,
+    **kwargs,
+):
+    """
+    Sends a request to the backend through the shared session.
+    Adds auth headers unless auth=False; explicit headers take precedence.
+
+    GETs with the same URL that are in flight at the same time are sent
+    once. By default only the same credentials share a call; pass
+    share_scope (see recruiter_scope) for data that is
+    identical for everyone in that scope.
+
+    Calls that cannot reach the backend, or whose endpoint group's circuit
+    is open, return a 503 response instead of raising. GETs fall back to
+    the last good copy, marked stale (see warn_if_stale).
+
+    Mutations that pass idempotent=<action name> carry an Idempotency-Key
+    header and are retried with jittered backoff on transient failures.
+    The key is reused until the backend gives a final answer, so a user
+    clicking submit again after a failure cannot create a duplicate.
+
+    GETs are bounded by the rerun budget (see start_run), and answered
+    at once when an earlier rerun prefetched them (see prefetch).
+
+    Every call is recorded in the client metrics under the current page.
+    """
+    merged = dict(auth_headers()) if auth else {}
+    if headers:
+        merged.update(headers)
+
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    # What the caller asked for, before the rerun budget cut it (see record_timeout).
+    requested = timeout if _requested is None else _requested
+    run = _run if _run is not None else current_run()
+    started = time.perf_counter()
+
+    if method == "GET":
+        timeout = budget_timeout(run, timeout)
+
+    prefetched = _take_prefetched(path, merged, kwargs.get("params")) if method == "GET" else None
+
+    if prefetched is not None:
+        res = prefetched
+    elif method == "GET" and timeout <= 0:
+        res = over_budget_response(path, merged, kwargs.get("params"))
+    elif idempotent is None:
+        res = _dispatch(method, path, merged, timeout, share_scope, requested, **kwargs)
+    else:
+        merged["Idempotency-Key"] = _idempotency_key(idempotent, method, path, kwargs)
+        res = _dispatch_with_retries(method, path, merged, timeout, **kwargs)
+        if not is_retryable(res):
+            st.session_state.get("_idempotency_keys", {}).pop(idempotent, None)
+
+    record_call(run, method, path, res, time.perf_counter() - started)
+    return res
+
+
+def _idempotency_key(action, method, path, kwargs):
+    """
+    Returns the Idempotency-Key of the pending submit of action.
+    A new key is made when the action is submitted with a different payload.
+    """
+    payload = (method, path, kwargs.get("params"), kwargs.get("json"), kwargs.get("data"))
+    fingerprint = hashlib.sha256(repr(payload).encode()).hexdigest()
+
+    keys = st.session_state.setdefault("_idempotency_keys", {})
+    pending = keys.get(action)
+    if pending is None or pending[0] != fingerprint:
+        pending = keys[action] = (fingerprint, uuid.uuid4().hex)
+    return pending[1]
+
+
+def over_budget_response(path, headers, params=None):
+    """
+    Answers a GET the rerun has no time left for, without sending it:
+    the last good copy, marked stale, or a 504.
+    """
+    url = api_url(path)
+    entry = get_conditional_cache().get(request_key(auth_scope(headers), url, params))
+    if entry is not None:
+        res = CachedResponse(entry, stale=True)
+    else:
+        res = unavailable_response(url, "Skipped: the page ran out of time", 504)
+    res.over_budget = True
+    return res
+
+
+def _dispatch_with_retries(method, path, headers, timeout, **kwargs):
+    breaker = get_breaker(endpoint_group(path))
+
+    for attempt in range(RETRY_POLICY.attempts):
+        res = _dispatch(method, path, headers, timeout, None, **kwargs)
+
+        last_attempt = attempt == RETRY_POLICY.attempts - 1
+        if last_attempt or not is_retryable(res) or breaker.state == CircuitBreaker.OPEN:
+            return res
+
+        time.sleep(RETRY_POLICY.delay(attempt, res))
+
+
+def _dispatch(method, path, headers, timeout, share_scope, requested=None, **kwargs):
+    url = api_url(path)
+    group = endpoint_group(path)
+
+    if method == "GET":
+        return _conditional_get(
+            url, group, headers, timeout, share_scope, requested=requested, **kwargs
+        )
+
+    try:
+        return _send(method, url, group, headers=headers, timeout=timeout, **kwargs)
+    except requests.RequestException as e:
+        return unavailable_response(url, str(e), _error_status(e))
+
+
+def _error_status(e) -> int:
+    return 504 if isinstance(e, requests.Timeout) else 503
+
+
+def _send(method, url, group, **kwargs):
+    """
+    Sends one call through the circuit breaker of its endpoint group.
+    """
+    breaker = get_breaker(group)
+    if not breaker.allow():
+        raise CircuitOpenError(f"Backend unavailable for /{group}, retrying shortly")
+
+    try:
+        res = get_session().request(method, url, **kwargs)
+    except requests.Timeout:
+        record_timeout(breaker, kwargs.get("timeout", DEFAULT_TIMEOUT))
+        raise
+    except requests.RequestException:
+        breaker.record_failure()
+        raise
+
+    if is_failure(res):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return res
+
+
+def record_timeout(breaker, timeout: float, requested: float = None):
+    """
+    Records a timed-out call on breaker. A call whose timeout the rerun
+    budget cut below the requested one says nothing about the backend, so
+    it is not counted; a timeout at full length counts as a failure.
+    """
+    if requested is not None and timeout < requested:
+        breaker.release()
+    else:
+        breaker.record_failure()
+
+
+def _conditional_get(
+    url, group, headers, timeout, share_scope=None, params=None, requested=None, **kwargs
+):
+    """
+    GETs url, revalidating any cached copy for the same user.
+    A 304 reply is answered from memory with the cached body.
+    """
+    scope = auth_scope(headers)
+    flight_key = request_key(share_scope or scope, url, params)
+    key = request_key(scope, url, params)
+
+    try:
+        return get_singleflight().do(
+            flight_key,
+            lambda: _revalidate(
+                key, url, group, headers, timeout, params, requested=requested, **kwargs
+            ),
+            timeout,
+        )
+    except requests.Timeout as e:
+        return abandoned_response(key, url, e)
+
+
+def abandoned_response(key, url, error):
+    """
+    Answers a GET that gave up waiting on an identical call made by
+    another session: the last good copy, marked stale, or a 504.
+    """
+    entry = get_conditional_cache().get(key)
+    if entry is not None:
+        return CachedResponse(entry, stale=True)
+    return unavailable_response(url, str(error), 504)
+
+
+def _revalidate(
+    key, url, group, headers, timeout, params, background=False, requested=None, **kwargs
+):
+    steps = revalidation(
+        key, url, group, headers, timeout, params, background, requested=requested, **kwargs
+    )
+    try:
+        send_headers = next(steps)
+        try:
+            res = get_session().get(
+                url, headers=send_headers, timeout=timeout, params=params, **kwargs
+            )
+        except requests.RequestException as e:
+            steps.throw(e)
+        else:
+            steps.send(res)
+    except StopIteration as done:
+        return done.value
+
+
+def revalidation(
+    key, url, group, headers, timeout, params, background=False, requested=None, **kwargs
+):
+    """
+    The conditional GET of url, whatever sends it (a generator shared by
+    the threaded and async engines).
+
+    Yields the headers to send the GET with, unless it can answer without
+    sending it; the sender then send()s back the response, or throw()s in
+    the transport error as a requests exception. Returns (as
+    StopIteration.value) the response for the caller: the reply, the
+    cached body for a 304, or the last good copy marked stale.
+    """
+    cache = get_conditional_cache()
+    entry = cache.get(key)
+    breaker = get_breaker(group)
+
+    # Stale-while-revalidate: while the group is degraded, answer from the
+    # last good copy at once and let a background call probe the backend.
+    degraded = breaker.state != CircuitBreaker.CLOSED
+    if entry is not None and degraded and not background:
+        get_executor().submit(
+            _revalidate, key, url, group, headers, timeout, params, True,
+            requested=requested, **kwargs
+        )
+        return CachedResponse(entry, stale=True)
+
+    if entry is not None:
+        headers = {**validator_headers(entry), **headers}
+
+    try:
+        if not breaker.allow():
+            raise CircuitOpenError(f"Backend unavailable for /{group}, retrying shortly")
+        try:
+            res = yield headers
+        except requests.Timeout:
+            record_timeout(breaker, timeout, requested)
+            raise
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+    except requests.RequestException as e:
+        if entry is not None:
+            return CachedResponse(entry, stale=True)
+        return unavailable_response(url, str(e), _error_status(e))
+
+    if is_failure(res):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+    if res.status_code == 304 and entry is not None:
+        return CachedResponse(entry)
+
+    if res.status_code == 200:
+        cache.store(key, res)
+    elif is_failure(res) and entry is not None:
+        return CachedResponse(entry, stale=True)
+
+    return res
+
+
+def warn_if_stale(res):
+    """
+    Shows a notice when a page renders a stale copy of a response.
+    Returns True if the response is stale.
+    """
+    if not getattr(res, "stale", False):
+        return False
+
+    age = int(time.time() - res.stored_at)
+    if getattr(res, "over_budget", False):
+        st.warning(f"⏱️ Backend is slow. Showing data from {age}s ago.")
+    else:
+        st.warning(f"⚠️ Backend is not responding. Showing data from {age}s ago.")
+    return True
+
+
+def recruiter_scope() -> str:
+    """
+    Coalescing scope for data owned by the logged-in recruiter.
+    """
+    return f"recruiter:{st.session_state.get('recruiter_id')}"
+
+
+def get(path: str, **kwargs):
+    return request("GET", path, **kwargs)
+
+
+def post(path: str, **kwargs):
+    return request("POST", path, **kwargs)
+
+
+def put(path: str, **kwargs):
+    return request("PUT", path, **kwargs)
+
+
+def patch(path: str, **kwargs):
+    return request("PATCH", path, **kwargs)
+
+
+def delete(path: str, **kwargs):
+    return request("DELETE", path, **kwargs)
+
+
+# -------------------------------
+# OPTIONAL AND BULK ENDPOINTS
+# -------------------------------
+# FastAPI's reply to a path no route matches. A route that exists but
+# rejects one item answers 404 with its own detail instead.
+ROUTE_NOT_FOUND = {"detail": "Not Found"}
+
+
+@st.cache_resource
+def _missing_endpoints():
+    """
+    path -> when the backend last said it has no such optional endpoint.
+    """
+    return {}
+
+
+def supports(path: str) -> bool:
+    """
+    False for MISSING_ENDPOINT_TTL seconds after route_missing(path, ...)
+    was True; callers then use their fallback.
+    """
+    missing_since = _missing_endpoints().get(path)
+    if missing_since is None:
+        return True
+    if time.monotonic() - missing_since >= MISSING_ENDPOINT_TTL:
+        _missing_endpoints().pop(path, None)
+        return True
+    return False
+
+
+def route_missing(path: str, res) -> bool:
+    """
+    True if res says the backend has no route for the optional endpoint
+    path: a 405, or a 404 with FastAPI's bare "Not Found". The endpoint is
+    then skipped for MISSING_ENDPOINT_TTL seconds (see supports). Other
+    404s, e.g. for one unknown item, are ordinary failures.
+    """
+    if res.status_code == 404:
+        try:
+            missing = res.json() == ROUTE_NOT_FOUND
+        except ValueError:
+            missing = False
+    else:
+        missing = res.status_code == 405
+
+    if missing:
+        _missing_endpoints()[path] = time.monotonic()
+    return missing
+
+
+def bulk_results(res, app_ids) -> dict:
+    """
+    Maps a bulk reply ({"results": [{application_id, ok, detail}]}) to
+    application_id -> error message, None where the item succeeded.
+    A failed call fails every item.
+    """
+    if res.status_code != 200:
+        return {app_id: res.text for app_id in app_ids}
+
+    results = {app_id: "No result returned" for app_id in app_ids}
+    for item in res.json().get("results", []):
+        if item.get("application_id") in results:
+            results[item["application_id"]] = (
+                None if item.get("ok") else item.get("detail") or "Update failed"
+            )
+    return results
+
+
+# -------------------------------
+# PARALLEL LOADER
+# -------------------------------
+@st.cache_resource
+def get_executor():
+    """
+    Returns the process-wide thread pool used by fetch_all.
+    """
+    return ThreadPoolExecutor(
+        max_workers=FANOUT_WORKERS,
+        thread_name_prefix="api-fanout",
+    )
+
+
+def fetch_all(calls: dict, *, headers=None, timeout=None):
+    """
+    Fetches several GET endpoints concurrently.
+
+    calls maps a name to (path, default) or (path, default, params).
+    Returns (results, errors). A call that fails, returns a non-200 status
+    or does not finish within timeout (or the rerun budget) gets its
+    default, and its error message is stored in errors under the same name.
+    """
+    # Worker threads have no Streamlit session, so resolve auth here.
+    headers = dict(auth_headers()) if headers is None else headers
+    run = current_run()
+    requested = DEFAULT_TIMEOUT if timeout is None else timeout
+    timeout = budget_timeout(run, requested)
+
+    executor = get_executor()
+    futures = {}
+    for name, (path, default, *rest) in calls.items():
+        params = rest[0] if rest else None
+
+        if timeout <= 0:
+            # Out of budget: answered from the cache at once, no worker needed.
+            futures[name] = Future()
+            futures[name].set_result(
+                get(path, auth=False, headers=headers, params=params, timeout=0, _run=run)
+            )
+            continue
+
+        futures[name] = executor.submit(
+            get,
+            path,
+            auth=False,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            _run=run,
+            _requested=requested,
+        )
+
+    wait(futures.values(), timeout=timeout)
+
+    results = {}
+    errors = {}
+    for name, (path, default, *rest) in calls.items():
+        future = futures[name]
+        results[name] = default
+
+        try:
+            if future.done():
+                res = future.result()
+            else:
+                future.cancel()
+                # Still running at the deadline: use the last good copy, if any.
+                res = over_budget_response(path, headers, rest[0] if rest else None)
+                if res.status_code != 200:
+                    errors[name] = "Request timed out"
+                    continue
+
+            if res.status_code != 200:
+                errors[name] = res.text
+                continue
+            results[name] = res.json()
+        except Exception as e:
+            errors[name] = str(e)
+
+    return results, errors
+
+
+@st.cache_resource
+def get_put_executor():
+    """
+    Returns the process-wide thread pool used by put_each.
+    """
+    return ThreadPoolExecutor(
+        max_workers=PUT_EACH_WORKERS,
+        thread_name_prefix="api-put-each",
+    )
+
+
+def put_each(calls: dict) -> dict:
+    """
+    Sends several PUTs concurrently, e.g. as the fallback of a bulk endpoint.
+    At most PUT_EACH_WORKERS are in flight across all sessions, on their
+    own pool, so page loads never queue behind them.
+
+    calls maps an id to (path, params). Returns id -> error message, with
+    None where the PUT returned 200.
+    """
+    # Worker threads have no Streamlit session, so resolve auth here.
+    headers = dict(auth_headers())
+    run = current_run()
+
+    futures = {
+        item: get_put_executor().submit(
+            put, path, auth=False, headers=headers, params=params, _run=run
+        )
+        for item, (path, params) in calls.items()
+    }
+
+    results = {}
+    for item, future in futures.items():
+        try:
+            res = future.result()
+            results[item] = None if res.status_code == 200 else res.text
+        except Exception as e:
+            results[item] = str(e)
+    return results
+
+
+# -------------------------------
+# PREFETCH
+# -------------------------------
+# Prefetched responses kept per session; the oldest is dropped first.
+MAX_PREFETCHED = 4
+
+
+def prefetch(path: str, *, params=None):
+    """
+    Starts a GET on the shared pool so that the same get() on a later
+    rerun of this session (e.g. the next page of a list) answers at once.
+    Results not used within PREFETCH_TTL seconds are thrown away.
+    """
+    headers = dict(auth_headers())
+    key = request_key(auth_scope(headers), api_url(path), params)
+
+    pending = st.session_state.setdefault("_api_prefetch", {})
+    if key in pending:
+        return
+
+    # Not part of this rerun: no budget, and not counted in its calls.
+    run = current_run()
+    background = {"page": run["page"], "calls": 0, "deadline": math.inf} if run else None
+
+    future = get_executor().submit(
+        get, path, auth=False, headers=headers, params=params, _run=background
+    )
+    pending[key] = (time.monotonic(), future)
+
+    while len(pending) > MAX_PREFETCHED:
+        pending.pop(next(iter(pending)))
+
+
+def drop_prefetched(path: str):
+    """
+    Throws away this session's prefetched GETs of path (any params), e.g.
+    after a change that makes them outdated.
+    """
+    pending = st.session_state.get("_api_prefetch")
+    if not pending:
+        return
+
+    url = api_url(path)
+    for key in [key for key in pending if key[1].split("?", 1)[0] == url]:
+        del pending[key]
+
+
+def _take_prefetched(path, headers, params):
+    """
+    Returns the finished, fresh prefetched 200 response for a GET, or None.
+    """
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+
+    pending = st.session_state.get("_api_prefetch")
+    if not pending:
+        return None
+
+    key = request_key(auth_scope(headers), api_url(path), params)
+    if key not in pending:
+        return None
+
+    started, future = pending[key]
+    if not future.done():
+        # Still in flight: the GET made instead is coalesced with it.
+        return None
+
+    del pending[key]
+    if time.monotonic() - started > PREFETCH_TTL or future.exception() is not None:
+        return None
+
+    res = future.result()
+    if res.status_code != 200:
+        return None
+    res.prefetched = True
+    return res
@@ -0,0 +1,197 @@
+import asyncio
+import itertools
+import os
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import requests
+import streamlit as st
+
+import api
+from auth import auth_headers
+from codec import loads
+from http_cache import auth_scope, request_key
+from resilience import endpoint_group
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+# "threads" uses api.fetch_all; "async" runs page fan-outs as coroutines on
+# one event loop per process. The shared thread pool is faster in
+# benchmarks/fanout_benchmark.py, so it is the default. Without httpx
+# installed, threads are used.
+FANOUT_ENGINE = os.getenv("API_FANOUT_ENGINE", "threads")
+
+# httpcore scans every connection of a pool on each request, so one large
+# HTTP/1.1 pool becomes CPU bound; API_POOL_SIZE is split over several clients.
+CLIENT_SHARDS = int(os.getenv("API_ASYNC_SHARDS", "8"))
+
+
+def enabled() -> bool:
+    return httpx is not None and FANOUT_ENGINE == "async"
+
+
+# -------------------------------
+# EVENT LOOP + CLIENT
+# -------------------------------
+@st.cache_resource
+def get_loop():
+    """
+    Returns the process-wide event loop, running in a daemon thread.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="api-async", daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def get_clients():
+    """
+    Returns the process-wide httpx clients, used round-robin.
+    With h2 installed and a TLS backend each client multiplexes its
+    requests over one HTTP/2 connection.
+    """
+    connections = max(1, api.POOL_SIZE // CLIENT_SHARDS)
+
+    async def make_clients():
+        return itertools.cycle([
+            httpx.AsyncClient(
+                http2=HTTP2,
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+                # The clients are shared between users, so they must never keep cookies.
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            )
+            for _ in range(CLIENT_SHARDS)
+        ])
+
+    return asyncio.run_coroutine_threadsafe(make_clients(), get_loop()).result()
+
+
+# -------------------------------
+# REQUESTS
+# -------------------------------
+async def _get(client, path, params, headers, timeout, requested, run):
+    """
+    GETs path like api.get: identical GETs in flight are sent once (also
+    with threads running api.get), and api.revalidation applies the cache
+    and breaker rules. Only the transport differs.
+    """
+    url = api.api_url(path)
+    key = request_key(auth_scope(headers), url, params)
+    started = time.perf_counter()
+
+    try:
+        res = await api.get_singleflight().do_async(
+            key,
+            lambda: _revalidate(
+                client, key, url, endpoint_group(path), headers, timeout, requested, params
+            ),
+            timeout,
+        )
+    except requests.Timeout as e:
+        res = api.abandoned_response(key, url, e)
+
+    api.record_call(run, "GET", path, res, time.perf_counter() - started)
+    return res
+
+
+async def _revalidate(client, key, url, group, headers, timeout, requested, params):
+    steps = api.revalidation(key, url, group, headers, timeout, params, requested=requested)
+    try:
+        send_headers = next(steps)
+        try:
+            res = await client.get(url, params=params, headers=send_headers, timeout=timeout)
+        except asyncio.CancelledError:
+            # Timed out by fetch_all: settle the breaker like any timeout.
+            try:
+                steps.throw(requests.Timeout("Cancelled at the deadline"))
+            except StopIteration:
+                pass
+            raise
+        except httpx.TimeoutException as e:
+            steps.throw(requests.Timeout(str(e) or type(e).__name__))
+        except httpx.HTTPError as e:
+            steps.throw(requests.ConnectionError(str(e) or type(e).__name__))
+        else:
+            steps.send(res)
+    except StopIteration as done:
+        return done.value
+
+
+async def _gather(clients, calls, headers, timeout, requested, run):
+    # Runs on the loop thread, so advancing the shared cycle is safe.
+    tasks = [
+        asyncio.wait_for(
+            _get(next(clients), path, rest[0] if rest else None, headers, timeout, requested, run),
+            timeout,
+        )
+        for path, _default, *rest in calls.values()
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def fetch_all(calls: dict, *, headers=None, timeout=None):
+    """
+    Same contract as api.fetch_all, but the GETs run as coroutines on the
+    shared event loop instead of occupying one pool thread each.
+    Falls back to api.fetch_all when the async engine is not available.
+    """
+    if not enabled():
+        return api.fetch_all(calls, headers=headers, timeout=timeout)
+
+    headers = dict(auth_headers()) if headers is None else headers
+    run = api.current_run()
+    requested = api.DEFAULT_TIMEOUT if timeout is None else timeout
+    timeout = api.budget_timeout(run, requested)
+    if timeout <= 0:
+        # Out of budget: api.fetch_all answers from the cache without I/O.
+        return api.fetch_all(calls, headers=headers, timeout=timeout)
+
+    clients = get_clients()
+
+    future = asyncio.run_coroutine_threadsafe(
+        _gather(clients, calls, headers, timeout, requested, run),
+        get_loop(),
+    )
+    responses = future.result()
+
+    results = {}
+    errors = {}
+    for (name, (path, default, *rest)), res in zip(calls.items(), responses):
+        results[name] = default
+
+        if isinstance(res, asyncio.TimeoutError):
+            # Still running at the deadline: use the last good copy, if any.
+            res = api.over_budget_response(path, headers, rest[0] if rest else None)
+            if res.status_code != 200:
+                errors[name] = "Request timed out"
+                continue
+        if isinstance(res, Exception):
+            errors[name] = str(res)
+            continue
+
+        try:
+            if res.status_code != 200:
+                errors[name] = res.text
+                continue
+            # CachedResponse memoises its decoded body; httpx responses do not.
+            results[name] = res.json() if isinstance(res, requests.Response) else loads(res.content)
+        except Exception as e:
+            errors[name] = str(e)
+
+    return results, errors
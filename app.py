@@ -1,13 +1,12 @@
 import streamlit as st
-import requests
-
-API_BASE = "http://127.0.0.1:8000"
+import api
 
 st.set_page_config(
     page_title="Recruitment Management Portal",
     page_icon="🎯",
     layout="centered"
 )
+api.start_run("app")
 
 st.title("🎯 Recruitment Management Portal")
 
@@ -37,8 +36,9 @@ def login_page():
     password = st.text_input("Password", type="password")
 
     if st.button("Login"):
-        response = requests.post(
-            f"{API_BASE}/login",
+        response = api.post(
+            "/login",
+            auth=False,
             data={"username": username, "password": password}
         )
 
@@ -87,7 +87,7 @@ def register_page():
             return
 
         if role == "recruiter":
-            url = f"{API_BASE}/auth/register/recruiter"
+            url = "/auth/register/recruiter"
             payload = {
                 "username": username,
                 "full_name": full_name,
@@ -100,7 +100,7 @@ def register_page():
                 "designation": designation,
             }
         else:
-            url = f"{API_BASE}/auth/register"
+            url = "/auth/register"
             payload = {
                 "username": username,
                 "full_name": full_name,
@@ -110,7 +110,7 @@ def register_page():
                 "role": role,
             }
 
-        response = requests.post(url, json=payload)
+        response = api.post(url, auth=False, json=payload)
 
         if response.status_code in [200, 201]:
             st.success("✅ Registration successful")
@@ -142,13 +142,14 @@ def hr_dashboard():
             "Authorization": f"Bearer {st.session_state.token}"
         }
 
-        response = requests.post(
-            f"{API_BASE}/recruiter/send-email",
+        response = api.post(
+            "/recruiter/send-email",
             params={
                 "candidate_email": candidate_email,
                 "subject": subject,
                 "message": message
             },
+            auth=False,
             headers=headers
         )
 
@@ -170,8 +171,9 @@ def candidate_dashboard():
             "Authorization": f"Bearer {st.session_state.token}"
         }
 
-        response = requests.get(
-            f"{API_BASE}/candidate/emails",
+        response = api.get(
+            "/candidate/emails",
+            auth=False,
             headers=headers
         )
 
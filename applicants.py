@@ -0,0 +1,322 @@
+import heapq
+import os
+import time
+
+import streamlit as st
+
+import api
+
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+# Seconds a local change is laid over loaded lists that still disagree
+# with it (a cached or prefetched copy from before the change).
+LOCAL_CHANGE_TTL = int(os.getenv("API_LOCAL_CHANGE_TTL", "60"))
+
+# Seconds a loaded applicant list or count is reused within a session.
+APPLICANTS_TTL = int(os.getenv("API_APPLICANTS_TTL", "60"))
+
+
+# -------------------------------
+# APPLICANT LISTS
+# -------------------------------
+COUNTS_PATH = "/applications/counts"
+
+
+@st.cache_resource
+def _versions() -> dict:
+    """
+    job_id -> version, bumped by invalidate(). Process-wide, so a change
+    made in one session is seen by every session's next load.
+    """
+    return {}
+
+
+def invalidate(job_id):
+    """
+    Drops every loaded page and count of job_id, including this session's
+    prefetched next pages; call after changing one of its applications.
+    """
+    versions = _versions()
+    versions[job_id] = versions.get(job_id, 0) + 1
+    api.drop_prefetched(f"/applications/job/{job_id}")
+
+
+def _cached(key, version, load):
+    """
+    Returns this session's copy of key if it was loaded at version less
+    than APPLICANTS_TTL seconds ago, else load()s it. Only good (200, not
+    stale) responses are kept.
+    """
+    cache = st.session_state.setdefault("_applicant_lists", {})
+    now = time.monotonic()
+
+    entry = cache.get(key)
+    if entry is not None and entry["version"] == version and now - entry["at"] < APPLICANTS_TTL:
+        return entry["res"]
+
+    res = load()
+    for old in [k for k, e in cache.items() if now - e["at"] >= APPLICANTS_TTL]:
+        del cache[old]
+    if res.status_code == 200 and not getattr(res, "stale", False):
+        cache[key] = {"res": res, "version": version, "at": now}
+    else:
+        cache.pop(key, None)
+    return res
+
+
+def get_applicants(job_id, params=None):
+    """
+    Returns the response of GET /applications/job/{job_id} (one page of
+    it with params). Both dashboard tabs share it for APPLICANTS_TTL
+    seconds, or until invalidate(job_id).
+    """
+    return _cached(
+        ("job", job_id, tuple(sorted((params or {}).items()))),
+        _versions().get(job_id, 0),
+        lambda: api.get(f"/applications/job/{job_id}", params=params),
+    )
+
+
+def get_all_applicants(job_id, page_size: int = 100):
+    """
+    Returns every applicant of job_id, following next_cursor through the
+    pages, or None if a page could not be loaded.
+    """
+    everyone = []
+    cursor = None
+    while True:
+        params = {"limit": page_size}
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        res = get_applicants(job_id, params)
+        if res.status_code != 200:
+            return None
+
+        data = res.json()
+        everyone.extend(data.get("applicants", []))
+        cursor = data.get("next_cursor")
+        if cursor is None:
+            return reconcile(everyone)
+
+
+def get_counts(job_ids) -> dict:
+    """
+    Returns {str(job_id): applicant count} for several jobs from one
+    GET /applications/counts?job_ids=1,2,3, or {} if the backend does not
+    have it or the call failed.
+    """
+    job_ids = list(job_ids)
+    if not job_ids or not api.supports(COUNTS_PATH):
+        return {}
+
+    versions = _versions()
+    res = _cached(
+        ("counts", tuple(job_ids)),
+        tuple(versions.get(job_id, 0) for job_id in job_ids),
+        lambda: api.get(COUNTS_PATH, params={"job_ids": ",".join(map(str, job_ids))}),
+    )
+
+    api.route_missing(COUNTS_PATH, res)
+    if res.status_code != 200:
+        return {}
+    return {str(job_id): count for job_id, count in res.json().items()}
+
+
+# -------------------------------
+# LOCAL CHANGES
+# -------------------------------
+def _changes() -> dict:
+    """
+    application_id -> {"fields", "at"} for this session's pending changes.
+    """
+    return st.session_state.setdefault("_applicant_changes", {})
+
+
+class LocalChange:
+    """
+    Fields of one application changed in this session ahead of the backend.
+    Shown at once; confirm() or rollback() once the backend has answered.
+    """
+
+    def __init__(self, app_id, fields: dict):
+        self.app_id = app_id
+        self.fields = fields
+        self._previous = _changes().get(app_id)
+
+        merged = dict(self._previous["fields"]) if self._previous else {}
+        merged.update(fields)
+        _changes()[app_id] = {"fields": merged, "at": time.monotonic()}
+
+    def confirm(self, res):
+        """
+        Keeps the change, taking the backend's value for any changed field
+        its reply carries.
+        """
+        entry = _changes().get(self.app_id)
+        if entry is None:
+            return
+        try:
+            body = res.json()
+        except ValueError:
+            body = None
+        if isinstance(body, dict):
+            for field in self.fields:
+                if field in body:
+                    entry["fields"][field] = body[field]
+        entry["at"] = time.monotonic()
+
+    def rollback(self):
+        """
+        Restores what was shown before the change.
+        """
+        if self._previous is None:
+            _changes().pop(self.app_id, None)
+        else:
+            _changes()[self.app_id] = self._previous
+
+
+def change(app_id, **fields) -> LocalChange:
+    """
+    Shows fields on application app_id from now on, e.g.
+    change(app_id, status="shortlisted").
+    """
+    return LocalChange(app_id, fields)
+
+
+def merged(app: dict) -> dict:
+    """
+    Returns app with this session's pending changes laid over it.
+    Never modifies app, which may be a shared cached copy.
+    """
+    entry = _changes().get(app.get("application_id"))
+    if entry is None:
+        return app
+    return {**app, **entry["fields"]}
+
+
+def reconcile(applications: list) -> list:
+    """
+    Lays pending changes over a loaded applicant list.
+    A change is dropped once the list shows it, or after LOCAL_CHANGE_TTL
+    seconds (the backend may have stored it differently, or someone
+    else changed it since).
+    """
+    changes = _changes()
+    now = time.monotonic()
+
+    result = []
+    for app in applications:
+        entry = changes.get(app.get("application_id"))
+        if entry is not None:
+            shown = all(app.get(field) == value for field, value in entry["fields"].items())
+            if shown or now - entry["at"] > LOCAL_CHANGE_TTL:
+                del changes[app["application_id"]]
+            else:
+                app = {**app, **entry["fields"]}
+        result.append(app)
+    return result
+
+
+# -------------------------------
+# BULK STATUS
+# -------------------------------
+BULK_STATUS_PATH = "/applications/bulk-status"
+
+
+def update_statuses(statuses: dict, *, action: str) -> dict:
+    """
+    Sets the status of several applications in one call.
+
+    statuses maps application_id -> new status. Returns
+    application_id -> error message, with None for the ones that succeeded.
+    Uses POST /applications/bulk-status; if the backend does not have it,
+    sends one PUT /applications/{id}/status per application, concurrently.
+    New statuses are shown at once and rolled back where the update failed.
+    """
+    local = {app_id: change(app_id, status=status) for app_id, status in statuses.items()}
+    results = _send_statuses(statuses, action)
+
+    for app_id, message in results.items():
+        if message is not None:
+            local[app_id].rollback()
+    return results
+
+
+def _send_statuses(statuses: dict, action: str) -> dict:
+    if api.supports(BULK_STATUS_PATH):
+        res = api.post(
+            BULK_STATUS_PATH,
+            json={
+                "updates": [
+                    {"application_id": app_id, "status": status}
+                    for app_id, status in statuses.items()
+                ]
+            },
+            idempotent=action,
+        )
+
+        if not api.route_missing(BULK_STATUS_PATH, res):
+            return api.bulk_results(res, statuses)
+
+    return api.put_each({
+        app_id: (f"/applications/{app_id}/status", {"status": status})
+        for app_id, status in statuses.items()
+    })
+
+
+# -------------------------------
+# RECRUITER ASSIGNMENT
+# -------------------------------
+def balance_assignments(job_id, applications: list, recruiter_names):
+    """
+    Proposes a recruiter for every unassigned application in applications
+    (e.g. the page shown), always picking the one with the fewest
+    applications of job_id so far (ties by name). Load is counted over
+    every applicant of the job, not only the given ones.
+    Returns application_id -> recruiter name, or None if the job's
+    applicants could not be loaded.
+    """
+    everyone = get_all_applicants(job_id)
+    if everyone is None:
+        return None
+
+    load = {name: 0 for name in recruiter_names}
+    for app in everyone:
+        name = app.get("assigned_recruiter_name")
+        if name in load:
+            load[name] += 1
+
+    heap = [(count, name) for name, count in load.items()]
+    heapq.heapify(heap)
+    if not heap:
+        return {}
+
+    proposals = {}
+    for app in applications:
+        if app.get("assigned_recruiter_name"):
+            continue
+        count, name = heapq.heappop(heap)
+        proposals[app["application_id"]] = name
+        heapq.heappush(heap, (count + 1, name))
+    return proposals
+
+
+def assign_recruiters(job_id, assignments: dict, *, action: str):
+    """
+    Assigns several applications in one POST /admin/assign-applications.
+    assignments maps application_id -> recruiter_id. Returns the response.
+    """
+    return api.post(
+        "/admin/assign-applications",
+        json={
+            "job_id": job_id,
+            "assignments": [
+                {"application_id": app_id, "recruiter_id": recruiter_id}
+                for app_id, recruiter_id in assignments.items()
+            ],
+        },
+        idempotent=action,
+    )
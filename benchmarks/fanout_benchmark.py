@@ -0,0 +1,198 @@
+"""
+Compares the page fan-out engines against a local backend stub.
+
+Each simulated session loads one page of --calls GETs, the way
+fetch_profile_data does. Sessions run concurrently, like Streamlit script
+threads.
+
+    python benchmarks/fanout_benchmark.py --sessions 200 --calls 6 --latency 0.05
+
+Engines:
+  per-load-pool  a new ThreadPoolExecutor(max_workers=calls) per page load
+  shared-pool    api.fetch_all (process-wide thread pool)
+  async          api_async.fetch_all (one event loop, needs httpx)
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# -------------------------------
+# BACKEND STUB
+# -------------------------------
+def _serve(latency: float, ports):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, Nagle
+        # plus delayed ACKs add ~40 ms per keep-alive response.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({"path": self.path, "items": list(range(50))}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_backend(latency: float) -> int:
+    """
+    Starts the stub in a child process so it does not compete with the
+    client for the GIL, and returns its port.
+    """
+    ports = multiprocessing.Queue()
+    multiprocessing.Process(target=_serve, args=(latency, ports), daemon=True).start()
+    return ports.get(timeout=10)
+
+
+# -------------------------------
+# THREAD SAMPLER
+# -------------------------------
+class ThreadSampler:
+    """
+    Tracks how many threads above the starting count were alive at once,
+    not counting the simulated sessions. Pools left idle by an engine that
+    ran earlier are part of the starting count.
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self._stop = threading.Event()
+        self._baseline = self._count()
+
+    def _count(self):
+        return sum(
+            1 for t in threading.enumerate()
+            if t.name != "sampler" and not t.name.startswith("session-")
+        )
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._count() - self._baseline)
+            time.sleep(0.002)
+
+    def __enter__(self):
+        threading.Thread(target=self._run, name="sampler", daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+
+
+# -------------------------------
+# ENGINES
+# -------------------------------
+def per_load_pool(calls):
+    import api
+
+    def fetch(path):
+        try:
+            return api.get(path, auth=False).json()
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {name: executor.submit(fetch, path) for name, (path, _default) in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def shared_pool(calls):
+    import api
+    return api.fetch_all(calls, headers={})[0]
+
+
+def async_engine(calls):
+    import api_async
+    return api_async.fetch_all(calls, headers={})[0]
+
+
+def run(engine, sessions: int, ncalls: int):
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+
+    def session(i):
+        calls = {f"c{n}": (f"/bench/{i}/{n}", None) for n in range(ncalls)}
+        started = time.perf_counter()
+        results = engine(calls)
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            failures.extend(name for name, value in results.items() if value is None)
+
+    threads = [
+        threading.Thread(target=session, args=(i,), name=f"session-{i}")
+        for i in range(sessions)
+    ]
+
+    started = time.perf_counter()
+    with ThreadSampler() as sampler:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "total_s": total,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "peak_threads": sampler.peak,
+        "failed": len(failures),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    port = start_backend(args.latency)
+    os.environ["API_BASE_URL"] = f"http://127.0.0.1:{port}"
+    # Measured even though threads are the default engine.
+    os.environ["API_FANOUT_ENGINE"] = "async"
+
+    import api_async
+
+    engines = {"per-load-pool": per_load_pool, "shared-pool": shared_pool}
+    if api_async.enabled():
+        engines["async"] = async_engine
+    else:
+        print("httpx not installed: skipping the async engine")
+
+    print(f"{args.sessions} sessions x {args.calls} GETs, {args.latency * 1000:.0f} ms backend latency")
+    print(f"{'engine':<15}{'total s':>10}{'p50 ms':>10}{'p95 ms':>10}{'new threads':>15}{'failed':>8}")
+    for name, engine in engines.items():
+        engine({"warmup": ("/warmup", None)})
+        stats = run(engine, args.sessions, args.calls)
+        print(
+            f"{name:<15}{stats['total_s']:>10.2f}{stats['p50_ms']:>10.0f}"
+            f"{stats['p95_ms']:>10.0f}{stats['peak_threads']:>15}{stats['failed']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# -------------------------------
+# TRANSPORT
+# -------------------------------
+# Every content coding urllib3 can decode here: gzip and deflate always,
+# br / zstd when brotli / zstandard are installed.
+ACCEPT_ENCODING_HEADER = ACCEPT_ENCODING.replace(",", ", ")
+
+
+# -------------------------------
+# JSON
+# -------------------------------
+def loads(data):
+    """
+    Decodes a JSON body with orjson when it is installed, else the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Not UTF-8, NaN / Infinity or integers above 64 bits.
+            pass
+    return json.loads(data)
+
+
+class ApiResponse(requests.Response):
+    """
+    Response whose json() decodes with orjson when it is installed.
+    """
+
+    def json(self, **kwargs):
+        if orjson is None or kwargs:
+            return super().json(**kwargs)
+        try:
+            return orjson.loads(self.content)
+        except orjson.JSONDecodeError:
+            # Let requests guess the encoding and raise its usual error.
+            return super().json()
+
+
+class ApiAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that returns ApiResponse objects.
+    """
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = ApiResponse
+        return response
@@ -0,0 +1,160 @@
+import os
+
+import streamlit as st
+
+import api
+from scheduling import BusyIndex, parse_time
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+# Seconds a recruiter's interviewer list is reused before it is refetched.
+INTERVIEWERS_TTL = int(os.getenv("API_INTERVIEWERS_TTL", "300"))
+
+# Seconds the recruiter directory is reused before it is refetched.
+RECRUITERS_TTL = int(os.getenv("API_RECRUITERS_TTL", "300"))
+
+# Seconds a recruiter's interviewer busy-time index is reused.
+BUSY_TTL = int(os.getenv("API_BUSY_TTL", "300"))
+
+
+class _Uncacheable(Exception):
+    """
+    Carries a result that must not be cached (a failed or stale load).
+    """
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+# -------------------------------
+# INTERVIEWERS
+# -------------------------------
+@st.cache_data(ttl=INTERVIEWERS_TTL, show_spinner=False)
+def _load_interviewers(recruiter_id):
+    # recruiter_id only keys the cache; the backend scopes by the auth token.
+    res = api.get("/interviewers", share_scope=api.recruiter_scope())
+
+    if res.status_code != 200:
+        raise _Uncacheable(None)
+    if getattr(res, "stale", False):
+        raise _Uncacheable(res.json())
+    return res.json()
+
+
+def get_interviewers():
+    """
+    Returns the logged-in recruiter's interviewers, or None if they could
+    not be loaded. Cached per recruiter for INTERVIEWERS_TTL seconds.
+    """
+    try:
+        return _load_interviewers(st.session_state.get("recruiter_id"))
+    except _Uncacheable as e:
+        return e.value
+
+
+def invalidate_interviewers():
+    """
+    Drops the logged-in recruiter's cached interviewers; call after adding one.
+    """
+    _load_interviewers.clear(st.session_state.get("recruiter_id"))
+
+
+# -------------------------------
+# RECRUITERS
+# -------------------------------
+class RecruiterDirectory:
+    """
+    Recruiter list with prebuilt name / id lookups.
+    Shared between sessions; treat it as read-only.
+    """
+
+    def __init__(self, recruiters: list):
+        self.recruiters = recruiters
+        self.name_by_id = {r["id"]: r["full_name"] for r in recruiters}
+        self.id_by_name = {r["full_name"]: r["id"] for r in recruiters}
+        self._excluding = {}
+
+    def excluding(self, recruiter_id) -> dict:
+        """
+        Returns {full_name: id} of every recruiter except recruiter_id
+        (a job's owner, or the logged-in recruiter). Built once per id.
+        """
+        view = self._excluding.get(recruiter_id)
+        if view is None:
+            view = {
+                name: rid for name, rid in self.id_by_name.items() if rid != recruiter_id
+            }
+            self._excluding[recruiter_id] = view
+        return view
+
+
+@st.cache_resource(ttl=RECRUITERS_TTL, show_spinner=False)
+def _load_recruiters(recruiter_id):
+    # recruiter_id only keys the cache; the backend scopes by the auth token.
+    res = api.get("/admin/recruiters", share_scope=api.recruiter_scope())
+
+    if res.status_code != 200:
+        raise _Uncacheable(None)
+    recruiters = RecruiterDirectory(res.json())
+    if getattr(res, "stale", False):
+        raise _Uncacheable(recruiters)
+    return recruiters
+
+
+def get_recruiter_directory():
+    """
+    Returns the RecruiterDirectory, or None if it could not be loaded.
+    One instance per recruiter is shared by their sessions for
+    RECRUITERS_TTL seconds.
+    """
+    try:
+        return _load_recruiters(st.session_state.get("recruiter_id"))
+    except _Uncacheable as e:
+        return e.value
+
+
+# -------------------------------
+# INTERVIEWER BUSY TIME
+# -------------------------------
+BUSY_PATH = "/interviewers/busy"
+
+
+@st.cache_resource(ttl=BUSY_TTL, show_spinner=False)
+def _load_busy(recruiter_id):
+    # recruiter_id only keys the cache; the backend scopes by the auth token.
+    res = api.get(BUSY_PATH, share_scope=api.recruiter_scope())
+
+    api.route_missing(BUSY_PATH, res)
+    if res.status_code != 200:
+        raise _Uncacheable(None)
+    index = BusyIndex(
+        (item["interviewer_id"], parse_time(item["start"]), parse_time(item["end"]))
+        for item in res.json()
+    )
+    if getattr(res, "stale", False):
+        raise _Uncacheable(index)
+    return index
+
+
+def get_busy_index():
+    """
+    Returns the BusyIndex of the logged-in recruiter's interviewers, built
+    from GET /interviewers/busy ([{interviewer_id, start, end}]), or None
+    if it could not be loaded. Cached per recruiter for BUSY_TTL seconds.
+    """
+    if not api.supports(BUSY_PATH):
+        return None
+    try:
+        return _load_busy(st.session_state.get("recruiter_id"))
+    except _Uncacheable as e:
+        return e.value
+
+
+def invalidate_busy_index():
+    """
+    Drops the logged-in recruiter's busy-time index; call after scheduling,
+    rescheduling or cancelling an interview.
+    """
+    _load_busy.clear(st.session_state.get("recruiter_id"))
@@ -0,0 +1,234 @@
+import asyncio
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from codec import ApiResponse
+
+
+# -------------------------------
+# CACHE KEYS
+# -------------------------------
+def auth_scope(headers) -> str:
+    """
+    Returns a stable, non-reversible id for the caller's credentials.
+    Cached entries are keyed by it so users never see each other's data.
+    """
+    token = (headers or {}).get("Authorization", "")
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def request_key(scope: str, url: str, params=None) -> tuple:
+    """
+    Returns the cache key for a GET of url with params on behalf of scope.
+    """
+    prepared = requests.PreparedRequest()
+    prepared.prepare_url(url, params)
+    return scope, prepared.url
+
+
+# -------------------------------
+# CACHED RESPONSES
+# -------------------------------
+class CachedResponse(ApiResponse):
+    """
+    Response rebuilt from a cache entry.
+    json() decodes the stored body once per entry and hands every caller
+    its own copy, so callers may edit what they get.
+    stale is True when the backend could not be reached to revalidate it.
+    """
+
+    from_cache = True
+
+    def __init__(self, entry: dict, stale: bool = False):
+        super().__init__()
+        self.stale = stale
+        self.stored_at = entry["stored_at"]
+        self._entry = entry
+        self._content = entry["content"]
+        self.status_code = 200
+        self.headers = CaseInsensitiveDict(entry["headers"])
+        self.encoding = entry["encoding"]
+        self.url = entry["url"]
+        self.reason = "OK"
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        if "json" not in self._entry:
+            self._entry["json"] = super().json()
+        return copy.deepcopy(self._entry["json"])
+
+
+# -------------------------------
+# CONDITIONAL GET CACHE
+# -------------------------------
+class ConditionalCache:
+    """
+    LRU store of the last good GET response per user and URL.
+    Entries with an ETag or Last-Modified validator are revalidated with
+    conditional requests; any entry can be served stale while the backend
+    is down. Bounded by both entry count and total body bytes; safe to
+    share between threads.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key, response):
+        """
+        Caches a 200 response; returns the entry or None if it is too large.
+        """
+        content = response.content
+        if len(content) > self.max_bytes:
+            self.discard(key)
+            return None
+
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content": content,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "url": str(response.url),
+            "stored_at": time.time(),
+        }
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old["content"])
+
+            self._entries[key] = entry
+            self._bytes += len(content)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted["content"])
+
+        return entry
+
+    def discard(self, key):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old["content"])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes}
+
+
+def validator_headers(entry) -> dict:
+    """
+    Returns the If-None-Match / If-Modified-Since headers for a cache entry.
+    """
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+# -------------------------------
+# REQUEST COALESCING
+# -------------------------------
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one.
+    The first caller runs the call; callers arriving while it is in flight
+    wait for it and receive the same result (or exception).
+    Threads use do(), coroutines do_async(); either may join the other's call.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.collapsed = 0
+
+    def _join(self, key):
+        """
+        Returns (future of the call in flight for key, True if the caller
+        must make the call itself).
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = Future()
+                return flight, True
+            self.collapsed += 1
+            return flight, False
+
+    def _land(self, key, flight, result=None, error=None):
+        with self._lock:
+            del self._flights[key]
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(result)
+
+    def do(self, key, fn, timeout=None):
+        """
+        Runs fn, or waits up to timeout seconds for the identical call in
+        flight. Raises requests.Timeout if that call does not finish in time.
+        """
+        flight, leader = self._join(key)
+
+        if not leader:
+            try:
+                return flight.result(timeout)
+            except TimeoutError:
+                raise requests.Timeout("Timed out waiting for an identical request")
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        self._land(key, flight, result)
+        return result
+
+    async def do_async(self, key, fn, timeout=None):
+        """
+        do() for coroutines: awaits fn(), or the identical call in flight,
+        without blocking the event loop.
+        """
+        flight, leader = self._join(key)
+
+        if not leader:
+            try:
+                # shield: giving up must not cancel the call for everyone else.
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(flight)), timeout)
+            except TimeoutError:
+                raise requests.Timeout("Timed out waiting for an identical request")
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._land(key, flight, error=requests.Timeout("The identical request was cancelled"))
+            raise
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        self._land(key, flight, result)
+        return result
@@ -0,0 +1,178 @@
+import streamlit as st
+
+import api
+
+
+# -------------------------------
+# JOBS DASHBOARD
+# -------------------------------
+DASHBOARD_PATH = "/jobs/dashboard"
+
+
+def _state() -> dict:
+    """
+    This session's copy of the dashboard: jobs by id, the sync cursor,
+    whether own jobs were synced as summaries, whether GET /jobs/owned
+    answered (None until asked, then True or False) and the loaded My Jobs
+    pages. Started over when another recruiter logs in.
+    """
+    recruiter_id = st.session_state.get("recruiter_id")
+    state = st.session_state.get("_job_sync")
+    if state is None or state["recruiter_id"] != recruiter_id:
+        state = st.session_state["_job_sync"] = {
+            "recruiter_id": recruiter_id,
+            "cursor": None,
+            "summary": False,
+            "owned_route": None,
+            "owned": {},
+            "shared": {},
+            "pages": {},
+        }
+    return state
+
+
+def sync_dashboard():
+    """
+    Brings this session's copy of /jobs/dashboard up to date.
+
+    The first call downloads every job. Later ones send the cursor of the
+    last reply (?since=) and get only what changed since:
+    {"owned_jobs": [...], "shared_jobs": [...], "cursor": ...,
+     "tombstones": [{"id", "reason"}]}
+    A tombstone with reason "archived" marks the job archived; any other
+    reason (deleted, unshared) removes it. A backend that sends no cursor
+    is reloaded in full every time; a 410 (cursor too old) triggers one.
+
+    Once GET /jobs/owned has served My Jobs (see owned_page), own jobs are
+    asked for as summaries (?owned=summary: id, title, is_active), which
+    is all the job picker needs.
+
+    Returns (res, data): data has "owned_jobs" and "shared_jobs", or is
+    None when res brought nothing usable.
+    """
+    state = _state()
+    state["pages"] = {}
+
+    summary = state["owned_route"] is True
+    if state["summary"] and not summary:
+        # Summaries cannot fill My Jobs: start over with a full load
+        state["cursor"] = None
+    state["summary"] = summary
+
+    params = {"owned": "summary"} if summary else {}
+    if state["cursor"] is not None:
+        params["since"] = state["cursor"]
+    res = api.get(DASHBOARD_PATH, params=params or None)
+
+    if res.status_code == 410 and "since" in params:
+        del params["since"]
+        state["cursor"] = None
+        res = api.get(DASHBOARD_PATH, params=params or None)
+
+    delta = "since" in params
+    if res.status_code != 200:
+        return res, None
+    if delta and getattr(res, "stale", False):
+        # An old delta must not be replayed over newer jobs
+        return res, _lists(state)
+
+    body = res.json()
+    if not delta or "cursor" not in body or body.get("full"):
+        state["owned"] = {job["id"]: job for job in body.get("owned_jobs", [])}
+        state["shared"] = {job["id"]: job for job in body.get("shared_jobs", [])}
+    else:
+        state["owned"] = _merge(state["owned"], body.get("owned_jobs", []))
+        state["shared"] = _merge(state["shared"], body.get("shared_jobs", []))
+        for tombstone in body.get("tombstones", []):
+            _bury(state, tombstone)
+
+    state["cursor"] = body.get("cursor")
+    return res, _lists(state)
+
+
+def _merge(jobs: dict, changed: list) -> dict:
+    # Updated jobs keep their place; new ones go first, like a full reload
+    new = {job["id"]: job for job in changed if job["id"] not in jobs}
+    merged = {**new, **jobs}
+    for job in changed:
+        merged[job["id"]] = job
+    return merged
+
+
+def _bury(state: dict, tombstone: dict):
+    job_id = tombstone.get("id")
+    for jobs in (state["owned"], state["shared"]):
+        if job_id not in jobs:
+            continue
+        if tombstone.get("reason") == "archived":
+            jobs[job_id] = {**jobs[job_id], "is_active": False}
+        else:
+            del jobs[job_id]
+
+
+def _lists(state: dict) -> dict:
+    return {
+        "owned_jobs": list(state["owned"].values()),
+        "shared_jobs": list(state["shared"].values()),
+    }
+
+
+# -------------------------------
+# MY JOBS
+# -------------------------------
+OWNED_PATH = "/jobs/owned"
+
+
+def owned_page(state: str, limit: int, cursor=None):
+    """
+    Returns one page of the recruiter's own jobs in state ("all",
+    "active" or "archived") as {"jobs", "counts", "next_cursor"}; counts
+    has the number of jobs in each state. None if it could not be loaded.
+
+    Uses GET /jobs/owned?state=&limit=&cursor=, so only that page is
+    sent. Pages are reused until the next sync_dashboard(). Without the
+    endpoint, which is not asked again this session once found missing,
+    the page is cut from the synced dashboard (reloaded in full first if
+    it only has summaries) and its cursor is an offset.
+    """
+    sync = _state()
+    key = (state, limit, cursor)
+    if key in sync["pages"]:
+        return sync["pages"][key]
+
+    if sync["owned_route"] is not False and api.supports(OWNED_PATH):
+        params = {"state": state, "limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        res = api.get(OWNED_PATH, params=params)
+
+        if not api.route_missing(OWNED_PATH, res):
+            if res.status_code != 200:
+                return None
+            sync["owned_route"] = True
+            page = res.json()
+            if not getattr(res, "stale", False):
+                sync["pages"][key] = page
+            return page
+        sync["owned_route"] = False
+
+    if sync["summary"]:
+        sync_dashboard()
+    return _local_page(sync, state, limit, cursor)
+
+
+def _local_page(sync: dict, state: str, limit: int, cursor) -> dict:
+    jobs = list(sync["owned"].values())
+    by_state = {
+        "all": jobs,
+        "active": [job for job in jobs if job.get("is_active", False)],
+        "archived": [job for job in jobs if not job.get("is_active", True)],
+    }
+
+    start = int(cursor or 0)
+    end = start + limit
+    return {
+        "jobs": by_state[state][start:end],
+        "counts": {name: len(selected) for name, selected in by_state.items()},
+        "next_cursor": str(end) if end < len(by_state[state]) else None,
+    }
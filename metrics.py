@@ -0,0 +1,190 @@
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# -------------------------------
+# BUCKETS
+# -------------------------------
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+RERUN_CALL_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+# Distinct endpoint labels kept before new ones are folded into "other".
+MAX_ENDPOINTS = 500
+
+_ID_SEGMENT = re.compile(r"\d|\.|^[0-9a-f]{16,}$|^[0-9a-f-]{32,36}$", re.IGNORECASE)
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Returns the templated form of an API path for use as a metric label.
+    "/applications/42/status" -> "/applications/{id}/status"
+    """
+    path = path.split("?", 1)[0]
+    segments = [
+        "{id}" if _ID_SEGMENT.search(segment) else segment
+        for segment in path.strip("/").split("/")
+    ]
+    return "/" + "/".join(segments)
+
+
+# -------------------------------
+# HISTOGRAM
+# -------------------------------
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum:g}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**values) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in values.items())
+
+
+# -------------------------------
+# REGISTRY
+# -------------------------------
+class ClientMetrics:
+    """
+    Aggregates backend calls made by the frontend, per page and endpoint.
+    Safe to share between threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency = {}
+        self._bytes = {}
+        self._requests = {}
+        self._reruns = {}
+        self._endpoints = set()
+
+    def observe_call(self, page, method, path, status, seconds, nbytes, source):
+        endpoint = endpoint_label(path)
+
+        with self._lock:
+            if endpoint not in self._endpoints:
+                if len(self._endpoints) >= MAX_ENDPOINTS:
+                    endpoint = "other"
+                self._endpoints.add(endpoint)
+
+            key = (page, method, endpoint)
+            self._latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self._bytes.setdefault(key, Histogram(BYTES_BUCKETS)).observe(nbytes)
+
+            count_key = key + (str(status), source)
+            self._requests[count_key] = self._requests.get(count_key, 0) + 1
+
+    def observe_rerun(self, page, calls):
+        with self._lock:
+            self._reruns.setdefault(page, Histogram(RERUN_CALL_BUCKETS)).observe(calls)
+
+    def render(self) -> str:
+        """
+        Returns all metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            lines.append("# HELP api_client_request_seconds Backend call latency seen by the frontend.")
+            lines.append("# TYPE api_client_request_seconds histogram")
+            for (page, method, endpoint), hist in sorted(self._latency.items()):
+                labels = _labels(page=page, method=method, endpoint=endpoint)
+                lines.extend(hist.render("api_client_request_seconds", labels))
+
+            lines.append("# HELP api_client_response_bytes Response body size of backend calls.")
+            lines.append("# TYPE api_client_response_bytes histogram")
+            for (page, method, endpoint), hist in sorted(self._bytes.items()):
+                labels = _labels(page=page, method=method, endpoint=endpoint)
+                lines.extend(hist.render("api_client_response_bytes", labels))
+
+            lines.append("# HELP api_client_requests_total Backend calls by status and where the answer came from.")
+            lines.append("# TYPE api_client_requests_total counter")
+            for (page, method, endpoint, status, source), count in sorted(self._requests.items()):
+                labels = _labels(
+                    page=page, method=method, endpoint=endpoint, status=status, source=source
+                )
+                lines.append(f"api_client_requests_total{{{labels}}} {count}")
+
+            lines.append("# HELP api_client_rerun_calls Backend calls made by one script run of a page.")
+            lines.append("# TYPE api_client_rerun_calls histogram")
+            for page, hist in sorted(self._reruns.items()):
+                lines.extend(hist.render("api_client_rerun_calls", _labels(page=page)))
+
+        return "\n".join(lines) + "\n"
+
+
+# -------------------------------
+# EXPORT
+# -------------------------------
+class FileExporter:
+    """
+    Rewrites a metrics file at most once every interval seconds.
+    """
+
+    def __init__(self, metrics: ClientMetrics, path: str, interval: float):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._written_at = 0.0
+        self._lock = threading.Lock()
+
+    def maybe_write(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._written_at < self.interval:
+                return
+            self._written_at = now
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.metrics.render())
+        os.replace(tmp_path, self.path)
+
+
+def serve_metrics(metrics: ClientMetrics, port: int):
+    """
+    Serves metrics at http://0.0.0.0:<port>/metrics from a daemon thread.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, name="api-metrics", daemon=True).start()
+    return server
@@ -1,10 +1,10 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers
+import api
+import api_async
+from auth import require_login
 import os
 from dotenv import load_dotenv
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
 import json
 import traceback
 from layout import render_sidebar
@@ -12,12 +12,12 @@ from layout import render_sidebar
 # ENV + CONFIG
 load_dotenv()
 
-API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 S3_BUCKET = os.getenv("S3_BUCKET_NAME", "candidate-profile-assets")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 
 st.set_page_config(page_title="Candidate Profile", layout="wide", page_icon="👤")
 require_login()
+api.start_run("candidate_profile")
 render_sidebar()
 role = st.session_state.get("role")
 
@@ -96,34 +96,16 @@ def parse_date(value, default_date):
 def fetch_profile_data(user_id: str, token: str):
     headers = {"Authorization": f"Bearer {token}"}
 
-    def safe_get(session, url, default=None):
-        try:
-            res = session.get(url, headers=headers, timeout=10)
-        except Exception:
-            return default
-        if res.status_code != 200:
-            return default
-        return res.json()
-
     endpoints = {
-        "profile": (f"{API_BASE}/candidate/profile", {}),
-        "completion": (f"{API_BASE}/candidate/profile-completion", {}),
-        "educations": (f"{API_BASE}/candidate/education", []),
-        "experiences": (f"{API_BASE}/candidate/experience", []),
-        "skills": (f"{API_BASE}/candidate/skills", []),
-        "projects": (f"{API_BASE}/candidate/projects", []),
+        "profile": ("/candidate/profile", {}),
+        "completion": ("/candidate/profile-completion", {}),
+        "educations": ("/candidate/education", []),
+        "experiences": ("/candidate/experience", []),
+        "skills": ("/candidate/skills", []),
+        "projects": ("/candidate/projects", []),
     }
 
-    results = {}
-    with requests.Session() as session:
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_map = {
-                executor.submit(safe_get, session, url, default): name
-                for name, (url, default) in endpoints.items()
-            }
-            for future in future_map:
-                name = future_map[future]
-                results[name] = future.result()
+    results, _errors = api_async.fetch_all(endpoints, headers=headers)
 
     return (
         results.get("profile", {}),
@@ -294,10 +276,9 @@ with col1:
 
         with st.spinner("Uploading profile photo..."):
             try:
-                res = requests.post(
-                    f"{API_BASE}/candidate/profile-picture",
+                res = api.post(
+                    "/candidate/profile-picture",
                     files=files,
-                    headers=auth_headers(),
                     timeout=30
                 )
 
@@ -339,11 +320,9 @@ with col2:
         col_save, col_cancel = st.columns(2)
         if col_save.button("Save", key="save_headline", use_container_width=True):
             try:
-                res = requests.put(
-                    f"{API_BASE}/candidate/profile",
+                res = api.put(
+                    "/candidate/profile",
                     json={"resume_headline": new_headline},
-                    headers=auth_headers(),
-                    timeout=10
                 )
                 if res.status_code == 200:
                     st.session_state.edit_resume_headline = False
@@ -448,11 +427,9 @@ if st.session_state.edit_basic_info:
             "profile_summary": profile_summary,
         }
 
-        res = requests.put(
-            f"{API_BASE}/candidate/profile",
+        res = api.put(
+            "/candidate/profile",
             json=payload,
-            headers=auth_headers(),
-            timeout=10
         )
 
         if res.status_code == 200:
@@ -644,11 +621,9 @@ else:
                         "years_of_experience": skill["years_of_experience"]
                     })
             
-            res = requests.put(
-                f"{API_BASE}/candidate/skills",
+            res = api.put(
+                "/candidate/skills",
                 json=valid_skills,  # empty list allowed
-                headers=auth_headers(),
-                timeout=10
             )
 
             if res.status_code == 200:
@@ -804,10 +779,7 @@ else:
         if delete_exp_index is not None:
             exp = st.session_state.experience_list[delete_exp_index]
 
-            res = requests.delete(
-                f"{API_BASE}/candidate/experience/{exp['id']}",
-                headers=auth_headers()
-            )
+            res = api.delete(f"/candidate/experience/{exp['id']}")
 
             if res.status_code == 204:
                 st.success("Experience deleted successfully ✅")
@@ -833,16 +805,14 @@ else:
                 }
 
                 if exp.get("id"):
-                    requests.put(
-                        f"{API_BASE}/candidate/experience/{exp['id']}",
+                    api.put(
+                        f"/candidate/experience/{exp['id']}",
                         json=payload,
-                        headers=auth_headers(),
                     )
                 else:
-                    requests.post(
-                        f"{API_BASE}/candidate/experience",
+                    api.post(
+                        "/candidate/experience",
                         json=payload,
-                        headers=auth_headers(),
                     )
 
             st.success("Experience saved successfully ✅")
@@ -966,10 +936,7 @@ else:
                     col_del, col_spacer = st.columns([1, 4])
                     with col_del:
                         if st.button("🗑️ Delete", key=f"del_edu_{i}"):
-                            res = requests.delete(
-                                f"{API_BASE}/candidate/education/{e['id']}",
-                                headers=auth_headers()
-                            )
+                            res = api.delete(f"/candidate/education/{e['id']}")
 
                             if res.status_code == 204:
                                 st.success("Education deleted successfully ✅")
@@ -1014,18 +981,14 @@ else:
                     }
                     
                     if edu.get("id"):
-                        response = requests.put(
-                            f"{API_BASE}/candidate/education/{edu['id']}",
+                        response = api.put(
+                            f"/candidate/education/{edu['id']}",
                             json=edu_data,
-                            headers=auth_headers(),
-                            timeout=10
                         )
                     else:
-                        response = requests.post(
-                            f"{API_BASE}/candidate/education",
+                        response = api.post(
+                            "/candidate/education",
                             json=edu_data,
-                            headers=auth_headers(),
-                            timeout=10
                         )
                     
                     if response.status_code in [200, 201]:
@@ -1161,10 +1124,7 @@ else:
         if delete_project_index is not None:
             proj = st.session_state.project_list[delete_project_index]
 
-            res = requests.delete(
-                f"{API_BASE}/candidate/projects/{proj['id']}",
-                headers=auth_headers(),
-            )
+            res = api.delete(f"/candidate/projects/{proj['id']}")
 
             if res.status_code == 204:
                 st.success("Project deleted successfully ✅")
@@ -1189,16 +1149,14 @@ else:
                 }
 
                 if proj.get("id"):
-                    res = requests.put(
-                        f"{API_BASE}/candidate/projects/{proj['id']}",
+                    res = api.put(
+                        f"/candidate/projects/{proj['id']}",
                         json=payload,
-                        headers=auth_headers(),
                     )
                 else:
-                    res = requests.post(
-                        f"{API_BASE}/candidate/projects",
+                    res = api.post(
+                        "/candidate/projects",
                         json=payload,
-                        headers=auth_headers(),
                     )
 
                 if res.status_code in (200, 201):
@@ -1,22 +1,15 @@
 import streamlit as st
-import requests
-
-from auth import require_role, auth_headers
+import api
+from auth import require_role
 from layout import render_sidebar
 
-# =================================================
-# CONFIG
-# ==================================================
-API_BASE = "http://localhost:8000"
-
-
-
 st.session_state.setdefault("applied_jobs", set())
 # ==================================================
 # PAGE SETUP
 # ==================================================
 st.set_page_config(page_title="Job Listings", layout="wide")
 require_role("user")
+api.start_run("job_listings")
 render_sidebar()
 
 st.title("💼 Job Opportunities")
@@ -61,9 +54,8 @@ def fetch_jobs():
     if min_experience > 0:
         params["min_experience"] = min_experience
 
-    res = requests.get(
-        f"{API_BASE}/jobs/search",
-        headers=auth_headers(),
+    res = api.get(
+        "/jobs/search",
         params=params,
     )
 
@@ -110,10 +102,7 @@ for job in jobs:
 
         # ---------------- JOB DESCRIPTION (PDF) ----------------
         if job.get("description_file_key"):
-            jd_res = requests.get(
-                f"{API_BASE}/job-descriptions/file/{job['description_file_key']}",
-                headers=auth_headers(),
-            )
+            jd_res = api.get(f"/job-descriptions/file/{job['description_file_key']}")
 
             if jd_res.status_code == 200:
                 st.link_button(
@@ -1,12 +1,11 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers
+import api
+from auth import require_login
 from layout import render_sidebar
 
-API = "http://localhost:8000"
-
 st.set_page_config(page_title="My Resumes", layout="wide")
 require_login()
+api.start_run("resume_upload")
 render_sidebar()
 
 st.title("📄 My Resumes")
@@ -22,10 +21,10 @@ with st.container(border=True):
 
     if file and st.button("Upload Resume", use_container_width=True):
         with st.spinner("Uploading resume..."):
-            res = requests.post(
-                f"{API}/resume/upload",
+            res = api.post(
+                "/resume/upload",
                 files={"file": (file.name, file, file.type)},
-                headers=auth_headers(),
+                timeout=30,
             )
             if res.ok:
                 st.success("Resume uploaded successfully")
@@ -36,12 +35,13 @@ with st.container(border=True):
 st.divider()
 
 # ---------------- FETCH RESUMES ----------------
-res = requests.get(f"{API}/resume/my-resumes", headers=auth_headers())
+res = api.get("/resume/my-resumes")
 
 if not res.ok:
     st.error("Failed to load resumes")
     st.stop()
 
+api.warn_if_stale(res)
 resumes = res.json().get("resumes", [])
 
 if not resumes:
@@ -75,20 +75,14 @@ for r in resumes:
         # -------- RIGHT --------
         with right:
             if st.button("👁 Preview", key=f"btn_preview_{resume_id}", use_container_width=True):
-                link_res = requests.get(
-                    f"{API}/resume/access/{resume_id}",
-                    headers=auth_headers(),
-                )
+                link_res = api.get(f"/resume/access/{resume_id}")
                 if link_res.ok:
                     st.session_state[preview_key] = link_res.json()["url"]
                 else:
                     st.error("Failed to load preview")
 
             if st.button("🔗 Share", key=f"btn_share_{resume_id}", use_container_width=True):
-                link_res = requests.get(
-                    f"{API}/resume/access/{resume_id}",
-                    headers=auth_headers(),
-                )
+                link_res = api.get(f"/resume/access/{resume_id}")
                 if link_res.ok:
                     st.session_state[share_key] = link_res.json()["url"]
                 else:
@@ -100,10 +94,7 @@ for r in resumes:
                     key=f"btn_primary_{resume_id}",
                     use_container_width=True,
                 ):
-                    requests.post(
-                        f"{API}/resume/set-primary/{resume_id}",
-                        headers=auth_headers(),
-                    )
+                    api.post(f"/resume/set-primary/{resume_id}")
                     st.rerun()
 
             with st.expander("✏ Rename Resume"):
@@ -113,10 +104,9 @@ for r in resumes:
                     key=f"rename_input_{resume_id}",
                 )
                 if st.button("Save Name", key=f"save_name_{resume_id}"):
-                    requests.patch(
-                        f"{API}/resume/rename/{resume_id}",
+                    api.patch(
+                        f"/resume/rename/{resume_id}",
                         params={"name": new_name},
-                        headers=auth_headers(),
                     )
                     st.success("Name updated")
                     st.rerun()
@@ -128,10 +118,7 @@ for r in resumes:
                     key=f"delete_{resume_id}",
                     use_container_width=True,
                 ):
-                    requests.delete(
-                        f"{API}/resume/delete/{resume_id}",
-                        headers=auth_headers(),
-                    )
+                    api.delete(f"/resume/delete/{resume_id}")
                     st.success("Resume deleted")
                     st.rerun()
 
@@ -1,11 +1,10 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers, logout
-
-API_BASE = "http://localhost:8000"
+import api
+from auth import require_login, logout
 
 st.set_page_config(page_title="My Applications", layout="wide")
 require_login()
+api.start_run("my_applications")
 
 # ---------------- SIDEBAR ----------------
 with st.sidebar:
@@ -17,10 +16,7 @@ st.title("📌 My Applications")
 st.caption("Track the status of jobs you have applied for")
 
 # ---------------- FETCH APPLICATIONS ----------------
-apps_res = requests.get(
-    f"{API_BASE}/applications/my",
-    headers=auth_headers(),
-)
+apps_res = api.get("/applications/my")
 
 if apps_res.status_code != 200:
     st.error("❌ Failed to load applications")
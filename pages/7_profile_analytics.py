@@ -1,15 +1,13 @@
 import streamlit as st
-import requests
+import api
 import matplotlib.pyplot as plt
-from auth import require_login, auth_headers
-import os
+from auth import require_login
 from dotenv import load_dotenv
 
 # -------------------------------------------------
 # CONFIG
 # -------------------------------------------------
 load_dotenv()
-API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 
 st.set_page_config(
     page_title="My Analytics",
@@ -21,6 +19,7 @@ st.set_page_config(
 # AUTH
 # -------------------------------------------------
 require_login()
+api.start_run("profile_analytics")
 
 role = st.session_state.get("role")
 if role != "user":
@@ -38,11 +37,7 @@ st.caption("Track your job applications and progress")
 # -------------------------------------------------
 @st.cache_data(ttl=120)
 def fetch_analytics():
-    res = requests.get(
-        f"{API_BASE}/candidate/profile-analytics",
-        headers=auth_headers(),
-        timeout=10
-    )
+    res = api.get("/candidate/profile-analytics")
     if res.status_code != 200:
         return None
     return res.json()
@@ -1,11 +1,11 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers, logout
-
-API_BASE = "http://localhost:8000"
+import api
+import api_async
+from auth import require_login, logout
 
 st.set_page_config(page_title="Admin Dashboard", layout="wide")
 require_login()
+api.start_run("admin_dashboard")
 
 # ==================================================
 # SIDEBAR
@@ -23,22 +23,22 @@ st.divider()
 # ==================================================
 # FETCH DATA
 # ==================================================
-def get_data(endpoint):
-    res = requests.get(
-        f"{API_BASE}{endpoint}",
-        headers=auth_headers(),
-    )
-    if res.status_code != 200:
-        st.error(res.text)
-        return None
-    return res.json()
-
-
-apps_per_job = get_data("/admin/applications-per-job")
-status_summary = get_data("/admin/application-status-summary")
-upcoming_interviews = get_data("/admin/upcoming-interviews")
-recent_resumes = get_data("/admin/recent-resumes")
-job_performance = get_data("/admin/job-performance")
+data, errors = api_async.fetch_all({
+    "apps_per_job": ("/admin/applications-per-job", None),
+    "status_summary": ("/admin/application-status-summary", None),
+    "upcoming_interviews": ("/admin/upcoming-interviews", None),
+    "recent_resumes": ("/admin/recent-resumes", None),
+    "job_performance": ("/admin/job-performance", None),
+})
+
+for message in errors.values():
+    st.error(message)
+
+apps_per_job = data["apps_per_job"]
+status_summary = data["status_summary"]
+upcoming_interviews = data["upcoming_interviews"]
+recent_resumes = data["recent_resumes"]
+job_performance = data["job_performance"]
 
 
 # ==================================================
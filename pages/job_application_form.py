@@ -1,11 +1,10 @@
 import streamlit as st
-import requests
-from auth import require_role, auth_headers
+import api
+from auth import require_role
 from layout import render_sidebar
 
-API_BASE = "http://localhost:8000"
-
 require_role("user")
+api.start_run("job_application_form")
 render_sidebar()
 
 job_id = st.session_state.get("apply_job_id")
@@ -17,10 +16,7 @@ if not job_id:
 st.title("📝 Job Application Form")
 
 # ---------------- FETCH QUESTIONS ----------------
-res = requests.get(
-    f"{API_BASE}/jobs/{job_id}/application-form",
-    headers=auth_headers(),
-)
+res = api.get(f"/jobs/{job_id}/application-form")
 
 questions = res.json() if res.status_code == 200 else []
 
@@ -64,10 +60,10 @@ if submit:
         ],
     }
 
-    res = requests.post(
-        f"{API_BASE}/applications/apply",
-        headers=auth_headers(),
+    res = api.post(
+        "/applications/apply",
         json=payload,
+        idempotent=f"apply_{job_id}",
     )
 
     if res.status_code == 200:
@@ -1,19 +1,19 @@
 import streamlit as st
 import boto3
 import os
-import requests
+import api
 from dotenv import load_dotenv
 
 # --------------------------------------------------
 # PAGE CONFIG
 # --------------------------------------------------
 st.set_page_config(page_title="Login | NMK Recruitment Portal", layout="centered")
+api.start_run("login")
 
 load_dotenv()
 
 AWS_REGION = os.getenv("AWS_REGION")
 COGNITO_CLIENT_ID = os.getenv("COGNITO_CLIENT_ID")
-API_BASE = "http://127.0.0.1:8000"
 
 cognito = boto3.client("cognito-idp", region_name=AWS_REGION)
 
@@ -165,10 +165,7 @@ if not st.session_state.show_reset:
             st.session_state["id_token"] = id_token
             st.session_state["access_token"] = access_token
 
-            backend_res = requests.post(
-                f"{API_BASE}/auth/complete-login",
-                headers={"Authorization": f"Bearer {id_token}"},
-            )
+            backend_res = api.post("/auth/complete-login")
 
             if backend_res.status_code != 200:
                 st.error("Backend sync failed")
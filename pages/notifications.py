@@ -1,22 +1,20 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers
+import api
+from auth import require_login
 from layout import render_sidebar
 
-API_BASE = "http://localhost:8000"
 require_login()
+api.start_run("notifications")
 render_sidebar()
 st.title("🔔 Notifications")
 
-res = requests.get(
-    f"{API_BASE}/notifications",
-    headers=auth_headers()
-)
+res = api.get("/notifications")
 
 if res.status_code != 200:
     st.error("Failed to load notifications")
     st.stop()
 
+api.warn_if_stale(res)
 notifications = res.json()
 
 if not notifications:
@@ -1,5 +1,5 @@
 import streamlit as st
-import requests
+import api
 import os
 from dotenv import load_dotenv
 from datetime import datetime
@@ -7,13 +7,13 @@ from textwrap import dedent
 
 # ---------------- CONFIG ----------------
 load_dotenv()
-API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 S3_BUCKET = os.getenv("S3_BUCKET_NAME", "candidate-profile-assets")
 
 st.set_page_config(
     page_title="Public Profile",
     layout="wide",
 )
+api.start_run("public_profile")
 
 # ---------------- STYLES ----------------
 st.markdown("""
@@ -98,7 +98,7 @@ if not username:
     st.error("Invalid profile link")
     st.stop()
 
-res = requests.get(f"{API_BASE}/candidate/public/{username}")
+res = api.get(f"/candidate/public/{username}", auth=False)
 if res.status_code != 200:
     st.error("Profile not found or not public")
     st.stop()
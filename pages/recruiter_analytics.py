@@ -1,6 +1,7 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers, logout
+import api
+import api_async
+from auth import require_login, logout
 from layout import render_sidebar
 import pandas as pd
 import plotly.express as px
@@ -31,31 +32,26 @@ st.title("📊 Recruiter Analytics")
 st.caption("Platform analytics & monitoring")
 
 require_login()
+api.start_run("recruiter_analytics")
 render_sidebar()
 
-API_BASE = "http://localhost:8000"
-
 # ==============================
-# SAFE API CALL FUNCTION
+# FETCH DATA (IN PARALLEL)
 # ==============================
-def get_data(endpoint):
-    try:
-        res = requests.get(
-            f"{API_BASE}{endpoint}",
-            headers=auth_headers(),
-        )
-        if res.status_code == 200:
-            return res.json()
-        return None
-    except Exception:
-        return None
-
-
-apps_per_job = get_data("/admin/recruiter/applications-per-job")
-status_summary = get_data("/admin/application-status-summary")
-upcoming_interviews = get_data("/admin/upcoming-interviews")
-job_performance = get_data("/admin/job-performance")
-candidates_needing_action = get_data("/admin/candidates-needing-action")
+# Failed sections fall back to None and render their empty state.
+data, _errors = api_async.fetch_all({
+    "apps_per_job": ("/admin/recruiter/applications-per-job", None),
+    "status_summary": ("/admin/application-status-summary", None),
+    "upcoming_interviews": ("/admin/upcoming-interviews", None),
+    "job_performance": ("/admin/job-performance", None),
+    "candidates_needing_action": ("/admin/candidates-needing-action", None),
+})
+
+apps_per_job = data["apps_per_job"]
+status_summary = data["status_summary"]
+upcoming_interviews = data["upcoming_interviews"]
+job_performance = data["job_performance"]
+candidates_needing_action = data["candidates_needing_action"]
 
 # ==============================
 # TOP METRICS
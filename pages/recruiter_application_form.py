@@ -1,12 +1,11 @@
 import streamlit as st
-import requests
-from auth import require_login, auth_headers
+import api
+from auth import require_login
 from layout import render_sidebar
 
-API_BASE = "http://localhost:8000"
-
 st.set_page_config(page_title="Application Form Builder", layout="wide")
 require_login()
+api.start_run("recruiter_application_form")
 render_sidebar()
 
 st.title("📝 Application Form Builder")
@@ -15,10 +14,7 @@ st.caption("Create a customizable application form for each job")
 # ==================================================
 # FETCH RECRUITER JOBS
 # ==================================================
-jobs_res = requests.get(
-    f"{API_BASE}/jobs/my",
-    headers=auth_headers(),
-)
+jobs_res = api.get("/jobs/my")
 
 if jobs_res.status_code != 200:
     st.error("Failed to load jobs")
@@ -130,9 +126,8 @@ if st.button("💾 Save Application Form"):
         st.error("Add at least one question before saving")
         st.stop()
 
-    res = requests.post(
-        f"{API_BASE}/jobs/{selected_job_id}/application-form",
-        headers=auth_headers(),
+    res = api.post(
+        f"/jobs/{selected_job_id}/application-form",
         json=st.session_state.questions,
     )
 
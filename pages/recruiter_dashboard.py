@@ -1,15 +1,20 @@
 import streamlit as st
-import requests
-from datetime import datetime
-
-from auth import require_login, auth_headers, logout
+import api
+import applicants
+import directory
+import job_sync
+import scheduling
+import uploads
+import pandas as pd
+from datetime import datetime, time, timedelta
+from streamlit.errors import StreamlitAPIException
+
+from auth import require_login, logout
 from layout import render_sidebar
 
 # ==================================================
 # CONFIG
 # ==================================================
-API_BASE = "http://localhost:8000"
-
 APPLICATION_STATUSES = [
     "applied",
     "shortlisted",
@@ -18,6 +23,13 @@ APPLICATION_STATUSES = [
     "rejected",
 ]
 
+# Candidates rendered per page in Candidate Management
+APPLICANT_PAGE_SIZES = [25, 50, 100]
+
+# Job cards rendered per page in My Jobs
+JOB_PAGE_SIZE = 20
+JOB_FILTERS = ["All", "Active", "Archived"]
+
 STATUS_ICONS = {
     "applied": "🟡",
     "shortlisted": "🟢",
@@ -31,6 +43,7 @@ STATUS_ICONS = {
 # ==================================================
 st.set_page_config(page_title="Recruiter Dashboard", layout="wide")
 require_login()
+api.start_run("recruiter_dashboard")
 
 role = st.session_state.get("role")
 if role != "recruiter":
@@ -59,23 +72,22 @@ st.session_state.setdefault("app_form_questions", [])# dashboard or candidates
 st.session_state.setdefault("share_job_id", None)
 
 # ==================================================
-# GLOBAL JOBS VARIABLE (USED ACROSS TABS)
+# FRAGMENTS
 # ==================================================
-jobs = st.session_state.get("jobs", [])
+def rerun_fragment():
+    """
+    Reruns only the calling fragment. When the fragment is being drawn
+    as part of a full run, Streamlit refuses that, so the page reruns.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
 # ==================================================
-# FETCH INTERVIEWERS (for interview scheduling)
+# GLOBAL JOBS VARIABLE (USED ACROSS TABS)
 # ==================================================
-interviewers_res = requests.get(
-    f"{API_BASE}/interviewers",
-    headers=auth_headers(),
-)
-
-if interviewers_res.status_code == 200:
-    INTERVIEWERS = interviewers_res.json()
-else:
-    INTERVIEWERS = []
-    st.warning("⚠️ Could not load interviewers list")
+jobs = st.session_state.get("jobs", [])
 
 # ==================================================
 # NAVIGATION TABS
@@ -161,8 +173,13 @@ if submit:
         st.stop()
 
     # ==================================================
-    # 1️⃣ CREATE JOB FIRST (TEXT OR EMPTY)
+    # 1️⃣ START JD UPLOAD (ONLY IF PDF), CREATE JOB MEANWHILE
     # ==================================================
+    upload = None
+    if desc_type == "Upload PDF / Word":
+        # Streams to object storage while the job is being created
+        upload = uploads.start_upload(jd_file)
+
     payload = {
         "title": title,
         "location": location,
@@ -176,36 +193,25 @@ if submit:
         "description_file_key": None,
     }
 
-    res = requests.post(
-        f"{API_BASE}/jobs/",
-        headers=auth_headers(),
+    res = api.post(
+        "/jobs/",
         json=payload,
+        idempotent="publish_job",
     )
 
     if res.status_code != 201:
+        # Do not leave the file in storage without a job
+        uploads.discard(upload)
         st.error(res.text)
         st.stop()
 
     created_job_id = res.json()["id"]  # ✅ NOW IT EXISTS
 
     # ==================================================
-    # 2️⃣ UPLOAD JD FILE (ONLY IF PDF)
+    # 2️⃣ LINK JD FILE (ONLY IF PDF)
     # ==================================================
     if desc_type == "Upload PDF / Word":
-        upload_res = requests.post(
-            f"{API_BASE}/job-descriptions/upload",
-            headers=auth_headers(),
-            params={"job_id": created_job_id},
-            files={
-                "file": (
-                    jd_file.name,
-                    jd_file.getvalue(),
-                    jd_file.type,
-                )
-            },
-        )
-
-        if upload_res.status_code != 200:
+        if uploads.attach(created_job_id, upload, jd_file) is not None:
             st.error("Failed to upload job description file")
             st.stop()
 
@@ -221,330 +227,364 @@ job_tab1, job_tab2 = st.tabs(["🧑‍💼 My Jobs", "🤝 Shared Jobs"])
 
 # -------- Fetch jobs (only when needed) --------
 if st.session_state.reload_jobs:
-    res = requests.get(
-        f"{API_BASE}/jobs/dashboard",
-        headers=auth_headers(),
-    )
+    # Only jobs changed since the last load are downloaded
+    res, data = job_sync.sync_dashboard()
 
-    if res.status_code != 200:
+    if res.status_code == 504 and "owned_jobs" in st.session_state:
+        # Out of time this run: keep the last loaded lists, retry next run
+        st.warning("⏱️ Jobs are taking long to load. Showing the last loaded list.")
+    elif data is None:
         st.error("❌ Failed to load jobs")
         st.stop()
+    else:
+        st.session_state.owned_jobs = data.get("owned_jobs", [])
+        st.session_state.shared_jobs = data.get("shared_jobs", [])
 
-    data = res.json()
-    st.session_state.owned_jobs = data.get("owned_jobs", [])
-    st.session_state.shared_jobs = data.get("shared_jobs", [])
-    st.session_state.reload_jobs = False
+        # A stale copy is shown once, then refetched when the backend recovers
+        st.session_state.reload_jobs = api.warn_if_stale(res)
 
 owned_jobs = st.session_state.get("owned_jobs", [])
 shared_jobs = st.session_state.get("shared_jobs", [])
 all_jobs = owned_jobs + shared_jobs
+
+# -------- My Jobs: only the selected state and page --------
+filter_option = st.session_state.get("jobs_filter", JOB_FILTERS[0])
+
+# cursors[i] opens page i; reset when the filter changes
+jobs_paging = st.session_state.get("jobs_paging")
+if not jobs_paging or jobs_paging["state"] != filter_option:
+    jobs_paging = st.session_state.jobs_paging = {
+        "state": filter_option,
+        "cursors": [None],
+        "index": 0,
+    }
+
+jobs_page = job_sync.owned_page(
+    filter_option.lower(), JOB_PAGE_SIZE, jobs_paging["cursors"][jobs_paging["index"]]
+)
+page_jobs = jobs_page["jobs"] if jobs_page else []
+
+# Applicant count of every job card shown, in one request
+applicant_counts = applicants.get_counts(job["id"] for job in page_jobs + shared_jobs)
 with job_tab1:
-    jobs = owned_jobs
     # -------- No jobs case --------
-    if not owned_jobs:
+    if jobs_page is None:
+        st.error("❌ Failed to load your jobs")
+    elif not jobs_page["counts"].get("all"):
         st.info("ℹ️ You have not posted any jobs yet.")
     else:
+        job_counts = jobs_page["counts"]
+
         # -------- Filter --------
-        filter_option = st.radio(
+        st.radio(
             "Filter Jobs",
-            ["All", "Active", "Archived"],
+            JOB_FILTERS,
             horizontal=True,
+            key="jobs_filter",
+            format_func=lambda option: (
+                f"{option} ({job_counts[option.lower()]})" if option.lower() in job_counts else option
+            ),
         )
 
-        def visible(job):
-            if filter_option == "All":
-                return True
-            if filter_option == "Active":
-                return job.get("is_active", False)
-            if filter_option == "Archived":
-                return not job.get("is_active", True)
-            return True
-        
-        for job in filter(visible, jobs):
-                    with st.container():
-
-                        # ================= JOB CARD =================
+        def turn_jobs_page(step, cursor=None):
+            if step > 0 and jobs_paging["index"] + 1 == len(jobs_paging["cursors"]):
+                jobs_paging["cursors"].append(cursor)
+            jobs_paging["index"] += step
+
+        @api.fragment
+        def share_panel(job):
+            # Own fragment: picking recruiters reruns only this panel
+            if st.session_state.get("share_job_id") != job["id"]:
+                return
+
+            st.subheader("🤝 Share Job With Recruiters")
+
+            recruiters = directory.get_recruiter_directory()
+
+            if recruiters is None:
+                st.error("Failed to load recruiters")
+            else:
+                # Exclude job owner
+                recruiter_map = recruiters.excluding(job.get("recruiter_id"))
+
+                selected_recruiters = st.multiselect(
+                    "Select recruiters",
+                    recruiter_map.keys(),
+                    key=f"share_select_{job['id']}"
+                )
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    if st.button("❌ Cancel Sharing", key=f"cancel_share_{job['id']}"):
+                        st.session_state.share_job_id = None
+                        rerun_fragment()
+
+                with col2:
+                    if st.button("✅ Share Job Now", key=f"confirm_share_{job['id']}"):
+
+                        if not selected_recruiters:
+                            st.warning("Please select at least one recruiter")
+                        else:
+                            res = api.post(
+                                f"/job-shares/{job['id']}/share",
+                                json=[recruiter_map[name] for name in selected_recruiters],
+                                idempotent=f"share_job_{job['id']}",
+                            )
+
+                            if res.status_code == 200:
+                                st.success("✅ Job shared successfully")
+                                st.session_state.share_job_id = None
+                                rerun_fragment()
+                            else:
+                                st.error(res.text)
+
+        @api.fragment
+        def job_card(job):
+            # Own fragment: buttons here rerun only this card
+            with st.container():
+
+                # ================= JOB CARD =================
+                st.markdown(
+                    """
+                    <div style="
+                        border:1px solid #e6e6e6;
+                        border-radius:12px;
+                        padding:18px;
+                        margin-bottom:18px;
+                        background-color:#ffffff;
+                    ">
+                    """,
+                    unsafe_allow_html=True,
+                )
+
+                # Check if this job is in edit mode
+                if st.session_state.edit_job_id == job["id"]:
+                    # EDIT MODE - Show form inline
+                    st.markdown("### ✏️ Edit Job")
+
+                    with st.form(f"inline_edit_{job['id']}"):
+                        col1, col2 = st.columns(2)
+                                
+                        with col1:
+                            edit_title = st.text_input("Job Title", job["title"])
+                            edit_location = st.text_input("Location", job.get("location", ""))
+                            edit_employment_type = st.selectbox(
+                                "Employment Type",
+                                ["Full-time", "Part-time", "Contract", "Internship"],
+                                index=["Full-time", "Part-time", "Contract", "Internship"]
+                                .index(job.get("employment_type", "Full-time")),
+                            )
+                                
+                        with col2:
+                            edit_min_exp = st.number_input("Min Experience (Years)", value=job.get("min_experience", 0.0))
+                            edit_max_exp = st.number_input("Max Experience (Years)", value=job.get("max_experience", 0.0))
+
+                        s1, s2 = st.columns(2)
+                        edit_salary_min = s1.number_input("Salary Min (₹ LPA)", value=job.get("salary_min", 0.0))
+                        edit_salary_max = s2.number_input("Salary Max (₹ LPA)", value=job.get("salary_max", 0.0))
+
+                        edit_skills = st.text_input(
+                            "Skills (comma separated)",
+                            ", ".join(job.get("skills", []))
+                        )
+
+                        edit_description = st.text_area(
+                            "Job Description",
+                            job.get("description", ""),
+                            height=140
+                        )
+
+                        c1, c2 = st.columns(2)
+
+                        if c1.form_submit_button("💾 Update Job"):
+                            api.put(
+                                f"/jobs/{job['id']}",
+                                json={
+                                    "title": edit_title,
+                                    "location": edit_location,
+                                    "min_experience": edit_min_exp,
+                                    "max_experience": edit_max_exp,
+                                    "salary_min": edit_salary_min,
+                                    "salary_max": edit_salary_max,
+                                    "employment_type": edit_employment_type,
+                                    "skills": [s.strip() for s in edit_skills.split(",") if s.strip()],
+                                    "description": edit_description,
+                                },
+                            )
+                            st.session_state.edit_job_id = None
+                            st.session_state.reload_jobs = True
+                            st.rerun()
+
+                        if c2.form_submit_button("❌ Cancel"):
+                            st.session_state.edit_job_id = None
+                            rerun_fragment()
+
+                else:
+                    # VIEW MODE - Show job details
+                    col1, col2 = st.columns([8, 4])
+
+                    with col1:
+                        st.markdown(f"## {job['title']}")
+                        st.caption(
+                            f"📍 {job.get('location','N/A')} | "
+                            f"💼 {job.get('employment_type','N/A')} | "
+                            f"{'🟢 Active' if job.get('is_active') else '🔴 Archived'}"
+                        )
+
+                        if str(job["id"]) in applicant_counts:
+                            st.badge(f"👥 {applicant_counts[str(job['id'])]} applicants", color="blue")
+
                         st.markdown(
+                            f"""
+                            **Experience:** {job.get('min_experience',0)} – {job.get('max_experience',0)} yrs  
+                            **Salary:** ₹ {job.get('salary_min',0)} – {job.get('salary_max',0)} LPA  
+                            **Skills:** {", ".join(job.get("skills", []))}
                             """
-                            <div style="
-                                border:1px solid #e6e6e6;
-                                border-radius:12px;
-                                padding:18px;
-                                margin-bottom:18px;
-                                background-color:#ffffff;
-                            ">
-                            """,
-                            unsafe_allow_html=True,
                         )
 
-                        # Check if this job is in edit mode
-                        if st.session_state.edit_job_id == job["id"]:
-                            # EDIT MODE - Show form inline
-                            st.markdown("### ✏️ Edit Job")
+                        with st.expander("📄 View Job Description"):
+                            st.write(job.get("description") or "No description")
 
-                            with st.form(f"inline_edit_{job['id']}"):
-                                col1, col2 = st.columns(2)
-                                
-                                with col1:
-                                    edit_title = st.text_input("Job Title", job["title"])
-                                    edit_location = st.text_input("Location", job.get("location", ""))
-                                    edit_employment_type = st.selectbox(
-                                        "Employment Type",
-                                        ["Full-time", "Part-time", "Contract", "Internship"],
-                                        index=["Full-time", "Part-time", "Contract", "Internship"]
-                                        .index(job.get("employment_type", "Full-time")),
-                                    )
-                                
-                                with col2:
-                                    edit_min_exp = st.number_input("Min Experience (Years)", value=job.get("min_experience", 0.0))
-                                    edit_max_exp = st.number_input("Max Experience (Years)", value=job.get("max_experience", 0.0))
-
-                                s1, s2 = st.columns(2)
-                                edit_salary_min = s1.number_input("Salary Min (₹ LPA)", value=job.get("salary_min", 0.0))
-                                edit_salary_max = s2.number_input("Salary Max (₹ LPA)", value=job.get("salary_max", 0.0))
-
-                                edit_skills = st.text_input(
-                                    "Skills (comma separated)",
-                                    ", ".join(job.get("skills", []))
-                                )
-
-                                edit_description = st.text_area(
-                                    "Job Description",
-                                    job.get("description", ""),
-                                    height=140
-                                )
-
-                                c1, c2 = st.columns(2)
-
-                                if c1.form_submit_button("💾 Update Job"):
-                                    requests.put(
-                                        f"{API_BASE}/jobs/{job['id']}",
-                                        headers=auth_headers(),
-                                        json={
-                                            "title": edit_title,
-                                            "location": edit_location,
-                                            "min_experience": edit_min_exp,
-                                            "max_experience": edit_max_exp,
-                                            "salary_min": edit_salary_min,
-                                            "salary_max": edit_salary_max,
-                                            "employment_type": edit_employment_type,
-                                            "skills": [s.strip() for s in edit_skills.split(",") if s.strip()],
-                                            "description": edit_description,
-                                        },
-                                    )
-                                    st.session_state.edit_job_id = None
-                                    st.session_state.reload_jobs = True
-                                    st.rerun()
+                    with col2:
+                        st.markdown("### Actions")
 
-                                if c2.form_submit_button("❌ Cancel"):
-                                    st.session_state.edit_job_id = None
-                                    st.rerun()
+                        if st.button("📝 Application Form", key=f"form_{job['id']}"):
+                            st.session_state.app_form_job_id = job["id"]
+                            st.session_state.app_form_questions = []
+                            st.switch_page("pages/recruiter_application_form.py")
+
+                        if st.button("✏️ Edit Job", key=f"edit_{job['id']}"):
+                            st.session_state.edit_job_id = job["id"]
+                            rerun_fragment()
+
+                        if st.button("👥 View Applicants", key=f"apps_{job['id']}"):
+                            if st.session_state.selected_job_id == job["id"]:
+                                st.session_state.selected_job_id = None
+                            else:
+                                st.session_state.selected_job_id = job["id"]
+                                st.session_state.selected_job_is_shared = False
+                            st.rerun()
 
+                        if job.get("recruiter_id") == st.session_state.get("recruiter_id"):
+                            if st.button("🤝 Share Job", key=f"share_{job['id']}"):
+                                st.session_state.share_job_id = job["id"]
+                                rerun_fragment()
+
+
+                        # Archive / Unarchive
+                        if job.get("is_active"):
+                            if st.button("🗑️ Archive", key=f"archive_{job['id']}"):
+                                api.delete(f"/jobs/{job['id']}")
+                                st.session_state.reload_jobs = True
+                                st.rerun()
                         else:
-                            # VIEW MODE - Show job details
-                            col1, col2 = st.columns([8, 4])
-
-                            with col1:
-                                st.markdown(f"## {job['title']}")
-                                st.caption(
-                                    f"📍 {job.get('location','N/A')} | "
-                                    f"💼 {job.get('employment_type','N/A')} | "
-                                    f"{'🟢 Active' if job.get('is_active') else '🔴 Archived'}"
-                                )
-
-                                st.markdown(
-                                    f"""
-                                    **Experience:** {job.get('min_experience',0)} – {job.get('max_experience',0)} yrs  
-                                    **Salary:** ₹ {job.get('salary_min',0)} – {job.get('salary_max',0)} LPA  
-                                    **Skills:** {", ".join(job.get("skills", []))}
-                                    """
-                                )
-
-                                with st.expander("📄 View Job Description"):
-                                    st.write(job.get("description") or "No description")
-
-                            with col2:
-                                st.markdown("### Actions")
-
-                                if st.button("📝 Application Form", key=f"form_{job['id']}"):
-                                    st.session_state.app_form_job_id = job["id"]
-                                    st.session_state.app_form_questions = []
-                                    st.switch_page("pages/recruiter_application_form.py")
-
-                                if st.button("✏️ Edit Job", key=f"edit_{job['id']}"):
-                                    st.session_state.edit_job_id = job["id"]
-                                    st.rerun()
+                            if st.button("♻️ Unarchive", key=f"unarchive_{job['id']}"):
+                                api.put(f"/jobs/{job['id']}/unarchive")
+                                st.session_state.reload_jobs = True
+                                st.rerun()
 
-                                if st.button("👥 View Applicants", key=f"apps_{job['id']}"):
-                                    if st.session_state.selected_job_id == job["id"]:
-                                        is_shared_job = st.session_state.get("selected_job_is_shared", False)
-                                        st.session_state.selected_job_id = None
-                                    else:
-                                        st.session_state.selected_job_id = job["id"]
-                                        st.session_state.selected_job_is_shared = False
-                                    st.rerun()
+                        # Permanent Delete (actually archive, backend-supported)
+                        if st.button("❌ Delete Job", key=f"delete_{job['id']}"):
+                            st.session_state.confirm_delete_job_id = job["id"]
+
+                        # Delete Confirmation
+                        if st.session_state.confirm_delete_job_id == job["id"]:
+                            st.warning("⚠️ Are you sure you want to delete (archive) this job?")
+                            c1, c2 = st.columns(2)
 
-                                if job.get("recruiter_id") == st.session_state.get("recruiter_id"):
-                                    if st.button("🤝 Share Job", key=f"share_{job['id']}"):
-                                        st.session_state.share_job_id = job["id"]
-                                        st.rerun()
-
-
-                                # Archive / Unarchive
-                                if job.get("is_active"):
-                                    if st.button("🗑️ Archive", key=f"archive_{job['id']}"):
-                                        requests.delete(
-                                            f"{API_BASE}/jobs/{job['id']}",
-                                            headers=auth_headers(),
-                                        )
-                                        st.session_state.reload_jobs = True
-                                        st.rerun()
+                            if c1.button("Cancel", key=f"cancel_{job['id']}"):
+                                st.session_state.confirm_delete_job_id = None
+                                rerun_fragment()
+
+                            if c2.button("Confirm Delete", key=f"confirm_{job['id']}"):
+                                res = api.delete(f"/jobs/{job['id']}/permanent")
+
+                                if res.status_code in (200, 204):
+                                    st.success("✅ Job permanently deleted")
+                                    st.session_state.confirm_delete_job_id = None
+                                    st.session_state.reload_jobs = True
+                                    st.rerun()
                                 else:
-                                    if st.button("♻️ Unarchive", key=f"unarchive_{job['id']}"):
-                                        requests.put(
-                                            f"{API_BASE}/jobs/{job['id']}/unarchive",
-                                            headers=auth_headers(),
-                                        )
-                                        st.session_state.reload_jobs = True
-                                        st.rerun()
-
-                                # Permanent Delete (actually archive, backend-supported)
-                                if st.button("❌ Delete Job", key=f"delete_{job['id']}"):
-                                    st.session_state.confirm_delete_job_id = job["id"]
-
-                                # Delete Confirmation
-                                if st.session_state.confirm_delete_job_id == job["id"]:
-                                    st.warning("⚠️ Are you sure you want to delete (archive) this job?")
-                                    c1, c2 = st.columns(2)
-
-                                    if c1.button("Cancel", key=f"cancel_{job['id']}"):
-                                        st.session_state.confirm_delete_job_id = None
-                                        st.rerun()
-
-                                    if c2.button("Confirm Delete", key=f"confirm_{job['id']}"):
-                                        res = requests.delete(
-                                            f"{API_BASE}/jobs/{job['id']}/permanent",
-                                            headers=auth_headers(),
-                                        )
-
-                                        if res.status_code in (200, 204):
-                                            st.success("✅ Job permanently deleted")
-                                            st.session_state.confirm_delete_job_id = None
-                                            st.session_state.reload_jobs = True
-                                            st.rerun()
-                                        else:
-                                            st.error(f"❌ Delete failed: {res.text}")
+                                    st.error(f"❌ Delete failed: {res.text}")
 
 
                                     
                                 
                             
-                        st.markdown("</div>", unsafe_allow_html=True)
-                        # 🤝 SHARE JOB PANEL
-                        if st.session_state.get("share_job_id") == job["id"]:
+                st.markdown("</div>", unsafe_allow_html=True)
+                # 🤝 SHARE JOB PANEL
+                share_panel(job)
 
-                            st.subheader("🤝 Share Job With Recruiters")
+                # ==================================================
+                # 👥 APPLICANTS VIEW (RENDERED ONCE)
+                # ==================================================
+                if st.session_state.selected_job_id == job["id"]:
 
-                            recruiters_res = requests.get(
-                                f"{API_BASE}/admin/recruiters",
-                                headers=auth_headers(),
-                            )
+                    st.divider()
 
-                            if not recruiters_res.ok:
-                                st.error("Failed to load recruiters")
-                            else:
-                                recruiters = recruiters_res.json()
+                    col1, col2 = st.columns([8, 2])
 
-                                # Exclude job owner
-                                recruiter_map = {
-                                    r["full_name"]: r["id"]
-                                    for r in recruiters
-                                    if r["id"] != job.get("recruiter_id")
-                                }
+                    with col1:
+                        st.subheader("👥 Applicants")
+                    job_id = st.session_state.selected_job_id
 
-                                selected_recruiters = st.multiselect(
-                                    "Select recruiters",
-                                    recruiter_map.keys(),
-                                    key=f"share_select_{job['id']}"
-                                )
-
-                                col1, col2 = st.columns(2)
-
-                                with col1:
-                                    if st.button("❌ Cancel Sharing", key=f"cancel_share_{job['id']}"):
-                                        st.session_state.share_job_id = None
-                                        st.rerun()
-
-                                with col2:
-                                    if st.button("✅ Share Job Now", key=f"confirm_share_{job['id']}"):
-
-                                        if not selected_recruiters:
-                                            st.warning("Please select at least one recruiter")
-                                        else:
-                                            res = requests.post(
-                                                f"{API_BASE}/job-shares/{job['id']}/share",
-                                                headers=auth_headers(),
-                                                json=[recruiter_map[name] for name in selected_recruiters],
-                                            )
-
-                                            if res.status_code == 200:
-                                                st.success("✅ Job shared successfully")
-                                                st.session_state.share_job_id = None
-                                                st.rerun()
-                                            else:
-                                                st.error(res.text)
-
-                                            
-                        # ==================================================
-                        # 👥 APPLICANTS VIEW (RENDERED ONCE)
-                        # ==================================================
-                        if st.session_state.selected_job_id == job["id"]:
-
-                            st.divider()
-
-                            col1, col2 = st.columns([8, 2])
-
-                            with col1:
-                                st.subheader("👥 Applicants")
-                            job_id = st.session_state.selected_job_id
-
-                            with col2:
-                                if st.button(
-                                    "❌ Close Applicants",
-                                    key=f"close_applicants_{job_id}"
-                                ):
-                                    st.session_state.selected_job_id = None
-                                    st.rerun()
+                    with col2:
+                        if st.button(
+                            "❌ Close Applicants",
+                            key=f"close_applicants_{job_id}"
+                        ):
+                            st.session_state.selected_job_id = None
+                            st.rerun()
 
 
                             
 
-                            apps_res = requests.get(
-                                f"{API_BASE}/applications/job/{job_id}",
-                                headers=auth_headers(),
+                    # Everyone, through the same cache as Candidate Management
+                    applications = applicants.get_all_applicants(job_id)
+                    if applications is None:
+                        st.error("Failed to load applicants")
+                        applications = []
+
+                    if not applications:
+                        st.info("ℹ️ No candidates have applied yet.")
+                    else:
+                        for app in applications:
+                            st.markdown(
+                                f"""
+                                **{STATUS_ICONS.get(app['status'], '⚪')} {app['candidate_name']}**  
+                                📧 {app['candidate_email']}  
+                                📞 {app.get('candidate_phone','-')}  
+                                🕒 {app.get('applied_at')}
+                                """
                             )
+                            st.markdown("---")
 
-                            if apps_res.status_code == 200:
-                                applications = apps_res.json().get("applicants", [])
-                            else:
-                                st.error("Failed to load applicants")
-                                applications = []
+                    st.markdown("</div>", unsafe_allow_html=True)
+
+        if not page_jobs:
+            st.info(f"ℹ️ No {filter_option.lower()} jobs.")
+
+        for job in page_jobs:
+            job_card(job)
+
+        if jobs_paging["index"] > 0 or jobs_page.get("next_cursor") is not None:
+            nav1, _, nav3 = st.columns([2, 6, 2])
+            nav1.button(
+                "⬅️ Previous",
+                key="jobs_prev",
+                disabled=jobs_paging["index"] == 0,
+                on_click=turn_jobs_page,
+                args=(-1,),
+            )
+            nav3.button(
+                "Next ➡️",
+                key="jobs_next",
+                disabled=jobs_page.get("next_cursor") is None,
+                on_click=turn_jobs_page,
+                args=(1, jobs_page.get("next_cursor")),
+            )
 
-                            if not applications:
-                                st.info("ℹ️ No candidates have applied yet.")
-                            else:
-                                for app in applications:
-                                    st.markdown(
-                                        f"""
-                                        **{STATUS_ICONS.get(app['status'], '⚪')} {app['candidate_name']}**  
-                                        📧 {app['candidate_email']}  
-                                        📞 {app.get('candidate_phone','-')}  
-                                        🕒 {app.get('applied_at')}
-                                        """
-                                    )
-                                    st.markdown("---")
-
-                            st.markdown("</div>", unsafe_allow_html=True)
 
 with job_tab2:
     jobs = st.session_state.get("shared_jobs", [])
@@ -560,6 +600,9 @@ with job_tab2:
                     f"💼 {job.get('employment_type','N/A')}"
                 )
 
+                if str(job["id"]) in applicant_counts:
+                    st.badge(f"👥 {applicant_counts[str(job['id'])]} applicants", color="blue")
+
                 st.markdown(
                     f"""
                     **Experience:** {job.get('min_experience',0)} – {job.get('max_experience',0)} yrs  
@@ -589,13 +632,14 @@ with tab2:
                 if not name or not email:
                     st.error("Name and Email are required")
                 else:
-                    res = requests.post(
-                        f"{API_BASE}/interviewers",
-                        headers=auth_headers(),
+                    res = api.post(
+                        "/interviewers",
                         json={"name": name, "email": email},
+                        idempotent="add_interviewer",
                     )
 
                     if res.status_code == 201:
+                        directory.invalidate_interviewers()
                         st.success("✅ Interviewer added successfully")
                         st.rerun()
                     else:
@@ -620,37 +664,802 @@ with tab2:
 
 
     # ---------------- Fetch Recruiters ----------------
-    recruiters_res = requests.get(
-        f"{API_BASE}/admin/recruiters",
-        headers=auth_headers(),
+    recruiters = directory.get_recruiter_directory()
+
+    # Everyone but me; built once and shared by every applicant below
+    assignable_recruiters = (
+        recruiters.excluding(st.session_state.get("recruiter_id")) if recruiters else {}
     )
 
-    recruiters = recruiters_res.json() if recruiters_res.ok else []
-    recruiter_map = {r["full_name"]: r["id"] for r in recruiters}
+    # ---------------- Fetch Applications (one page) ----------------
+    page_size = st.selectbox("Candidates per page", APPLICANT_PAGE_SIZES, key="apps_page_size")
 
-    # ---------------- Fetch Applications ----------------
-    apps_res = requests.get(
-        f"{API_BASE}/applications/job/{job_id}",
-        headers=auth_headers(),
-    )
+    # cursors[i] opens page i; reset when the job or page size changes
+    paging = st.session_state.get("apps_paging")
+    if not paging or paging["job_id"] != job_id or paging["size"] != page_size:
+        paging = st.session_state.apps_paging = {
+            "job_id": job_id,
+            "size": page_size,
+            "cursors": [None],
+            "index": 0,
+        }
+
+    # Cleared once the backend is seen to ignore limit / cursor
+    server_paging = st.session_state.setdefault("apps_server_paging", True)
+
+    cursor = paging["cursors"][paging["index"]]
+    apps_path = f"/applications/job/{job_id}"
+
+    def page_params(cursor):
+        params = {"limit": page_size}
+        if cursor is not None:
+            params["cursor"] = cursor
+        return params
+
+    apps_res = applicants.get_applicants(job_id, page_params(cursor) if server_paging else None)
 
     if not apps_res.ok:
         st.error(f"Failed to load candidates: {apps_res.text}")
         st.stop()
 
+    api.warn_if_stale(apps_res)
     data = apps_res.json()
     applications = data.get("applicants", [])
 
+    if "next_cursor" in data:
+        next_cursor = data["next_cursor"]
+        total = data.get("total")
+        first = paging["index"] * page_size
+    else:
+        # Backend without pagination: it sent everyone, render one window
+        server_paging = st.session_state.apps_server_paging = False
+        total = len(applications)
+        first = int(cursor or 0)
+        applications = applications[first:first + page_size]
+        next_cursor = str(first + page_size) if first + page_size < total else None
+
+    # Changes saved from the cards below stay visible over an older copy
+    applications = applicants.reconcile(applications)
+
     # ✅ THIS IS NOT AN ERROR
     if not applications:
         st.info("ℹ️ No candidates have applied for this job yet.")
         st.stop()
 
+    if next_cursor is not None and server_paging:
+        api.prefetch(apps_path, params=page_params(next_cursor))
+
+    def turn_page(step, cursor=None):
+        if step > 0 and paging["index"] + 1 == len(paging["cursors"]):
+            paging["cursors"].append(cursor)
+        paging["index"] += step
+
+    nav1, nav2, nav3 = st.columns([2, 6, 2])
+    nav1.button(
+        "⬅️ Previous",
+        key="apps_prev",
+        disabled=paging["index"] == 0,
+        on_click=turn_page,
+        args=(-1,),
+    )
+    last = first + len(applications)
+    nav2.caption(
+        f"Showing {first + 1}–{last} of {total}" if total is not None else f"Showing {first + 1}–{last}"
+    )
+    nav3.button(
+        "Next ➡️",
+        key="apps_next",
+        disabled=next_cursor is None,
+        on_click=turn_page,
+        args=(1, next_cursor),
+    )
+
+    # ==================================================
+    # BULK STATUS UPDATE
+    # ==================================================
+    bulk_result = st.session_state.pop("bulk_result", None)
+    if bulk_result:
+        updated, failed = bulk_result
+        if updated:
+            st.success(f"✅ Status updated for {updated} candidate(s)")
+        for name, message in failed:
+            st.error(f"{name}: {message}")
+
+    # Ticking a card only reruns that card, so the selection is read when
+    # a button here is clicked rather than shown as a live count.
+    def selected_ids():
+        return [
+            app["application_id"]
+            for app in applications
+            if st.session_state.get(f"bulk_{app['application_id']}")
+        ]
+
+    def select_page(value=None):
+        if value is None:
+            value = not selected_ids()
+        for app in applications:
+            st.session_state[f"bulk_{app['application_id']}"] = value
+
+    with st.container(border=True):
+        b1, b2, b3, b4 = st.columns([3, 3, 2, 2])
+        b1.write("☑️ Tick candidates below, then apply a status")
+        bulk_status = b2.selectbox("Set status to", APPLICATION_STATUSES, key="bulk_status")
+        b3.button(
+            "Select / clear page",
+            key="bulk_select",
+            on_click=select_page,
+        )
+
+        if b4.button("💾 Apply", key="bulk_apply"):
+            picked = selected_ids()
+
+            if not picked:
+                st.warning("Please select at least one candidate")
+            else:
+                errors = applicants.update_statuses(
+                    {app_id: bulk_status for app_id in picked},
+                    action=f"bulk_status_{job_id}",
+                )
+                names = {app["application_id"]: app.get("candidate_name", "Unknown") for app in applications}
+
+                applicants.invalidate(job_id)
+                st.session_state.bulk_result = (
+                    sum(1 for message in errors.values() if message is None),
+                    [(names[app_id], message) for app_id, message in errors.items() if message is not None],
+                )
+                # Keep failed candidates selected so they can be retried
+                select_page(False)
+                for app_id, message in errors.items():
+                    if message is not None:
+                        st.session_state[f"bulk_{app_id}"] = True
+                st.rerun()
+
+    # ==================================================
+    # BATCH RECRUITER ASSIGNMENT
+    # ==================================================
+    if assignable_recruiters:
+        with st.expander("🧮 Assign Recruiters in Bulk"):
+            grid_key = f"assign_grid_{job_id}_{paging['index']}"
+            proposals_key = f"{grid_key}_proposals"
+
+            if st.button("⚖️ Auto-balance unassigned", key="assign_balance"):
+                proposals = applicants.balance_assignments(
+                    job_id, applications, assignable_recruiters.keys()
+                )
+                if proposals is None:
+                    st.error("Failed to load candidates")
+                else:
+                    st.session_state[proposals_key] = proposals
+                    # Drop earlier edits so the grid shows the proposals
+                    st.session_state.pop(grid_key, None)
+
+            proposals = st.session_state.get(proposals_key, {})
+            grid = pd.DataFrame(
+                [
+                    {
+                        "Candidate": app.get("candidate_name", "Unknown"),
+                        "Status": app.get("status", "applied"),
+                        "Assigned Recruiter": proposals.get(
+                            app["application_id"], app.get("assigned_recruiter_name")
+                        ),
+                    }
+                    for app in applications
+                ],
+                index=[app["application_id"] for app in applications],
+            )
+
+            edited = st.data_editor(
+                grid,
+                key=grid_key,
+                hide_index=True,
+                disabled=["Candidate", "Status"],
+                column_config={
+                    "Assigned Recruiter": st.column_config.SelectboxColumn(
+                        options=list(assignable_recruiters),
+                    ),
+                },
+            )
+
+            # Only rows whose recruiter actually changed are sent
+            changes = {}
+            for app in applications:
+                name = edited.at[app["application_id"], "Assigned Recruiter"]
+                if name in assignable_recruiters and name != app.get("assigned_recruiter_name"):
+                    changes[app["application_id"]] = assignable_recruiters[name]
+
+            if st.button(
+                f"✅ Save {len(changes)} Assignment(s)",
+                key="assign_grid_save",
+                disabled=not changes,
+            ):
+                res = applicants.assign_recruiters(
+                    job_id, changes, action=f"assign_grid_{job_id}"
+                )
+
+                if res.status_code == 200:
+                    for app_id in changes:
+                        applicants.change(
+                            app_id, assigned_recruiter_name=edited.at[app_id, "Assigned Recruiter"]
+                        )
+                    applicants.invalidate(job_id)
+                    st.session_state.pop(proposals_key, None)
+                    st.session_state.pop(grid_key, None)
+                    st.success("Recruiters assigned successfully")
+                    st.rerun()
+                else:
+                    st.error(res.text)
+
+    # ==================================================
+    # BULK INTERVIEW SLOTS
+    # ==================================================
+    def clash_checker(selected_interviewers):
+        # Returns check(start, end) -> names of the selected interviewers
+        # already busy then, or None when busy times are not available
+        busy = directory.get_busy_index() if selected_interviewers else None
+        if busy is None:
+            return None
+
+        names = {i["id"]: i["name"] for i in selected_interviewers}
+        return lambda start, end: [names[i] for i in busy.clashes(names, start, end)]
+
+    def slot_inputs(key, clashes=None):
+        # Date and time slots of a slot-based interview
+        interview_date = st.date_input(
+            "Interview Date",
+            key=f"date_{key}",
+        )
+
+        st.markdown("### ⏱ Available Time Slots")
+
+        slot_count = st.number_input(
+            "Number of Slots",
+            min_value=1,
+            max_value=5,
+            value=2,
+            key=f"slot_count_{key}",
+        )
+
+        slots = []
+
+        for i in range(int(slot_count)):
+            c1, c2 = st.columns(2)
+            with c1:
+                start = st.time_input(
+                    f"Slot {i+1} Start",
+                    key=f"start_{key}_{i}",
+                )
+            with c2:
+                end = st.time_input(
+                    f"Slot {i+1} End",
+                    key=f"end_{key}_{i}",
+                )
+
+            slots.append({
+                "start_time": start.strftime("%H:%M"),
+                "end_time": end.strftime("%H:%M"),
+            })
+
+            if clashes is not None:
+                busy_names = clashes(
+                    datetime.combine(interview_date, start),
+                    datetime.combine(interview_date, end),
+                )
+                if busy_names:
+                    st.warning(f"⚠️ Slot {i+1} clashes with interviews of {', '.join(busy_names)}")
+
+        return interview_date, slots
+
+    @api.fragment
+    def bulk_slots(candidates):
+        # Own fragment: filling it in reruns only this section
+        bulk_section = st.expander(
+            "📨 Send Interview Slots in Bulk",
+            expanded=False,
+            key="bulk_slots_section",
+            on_change="rerun",
+        )
+        with bulk_section:
+            slots_result = st.session_state.pop("bulk_slots_result", None)
+            if slots_result:
+                sent, failed = slots_result
+                if sent:
+                    st.success(f"✅ Interview slots sent to {sent} candidate(s)")
+                for name, message in failed:
+                    st.error(f"{name}: {message}")
+
+            # Interviewers are only loaded while this section is open
+            if not bulk_section.open:
+                return
+
+            interviewers = directory.get_interviewers()
+            if not interviewers:
+                st.warning("⚠️ No interviewers available. Please add interviewers first.")
+                return
+
+            plan_mode = st.radio(
+                "Slots",
+                ["Same slots for everyone", "Propose slots per candidate"],
+                horizontal=True,
+                key="bulk_slots_mode",
+            )
+
+            if plan_mode == "Same slots for everyone":
+                if not candidates:
+                    st.info("ℹ️ No shortlisted candidates without an interview on this page.")
+                    return
+
+                names = {app["application_id"]: app.get("candidate_name", "Unknown") for app in candidates}
+                picked = st.multiselect(
+                    "Shortlisted candidates on this page",
+                    list(names),
+                    default=list(names),
+                    format_func=names.get,
+                    key=f"bulk_slots_candidates_{job_id}_{paging['index']}",
+                )
+            else:
+                # Every shortlisted candidate of the job, not only this page
+                everyone = applicants.get_all_applicants(job_id)
+                if everyone is None:
+                    st.error("Failed to load candidates")
+                    return
+
+                names = {
+                    app["application_id"]: app.get("candidate_name", "Unknown")
+                    for app in everyone
+                    if app.get("status", "").lower() == "shortlisted" and not app.get("scheduled_at")
+                }
+                picked = list(names)
+                st.caption(f"{len(picked)} shortlisted candidate(s) without an interview")
+
+            interview_type = st.selectbox(
+                "Interview Type",
+                ["online", "offline", "telephone"],
+                key="bulk_slots_type",
+            )
+
+            meeting_link = None
+            location = None
+
+            if interview_type == "online":
+                meeting_link = st.text_input(
+                    "Meeting Link",
+                    placeholder="https://meet.google.com/abc-defg-hij",
+                    key="bulk_slots_link",
+                )
+            elif interview_type == "offline":
+                location = st.text_input(
+                    "Interview Location",
+                    placeholder="Office address or venue",
+                    key="bulk_slots_loc",
+                )
+            else:
+                st.info("ℹ️ Interviews will be conducted via phone call")
+
+            selected_interviewers = st.multiselect(
+                "Choose Interviewers",
+                options=interviewers,
+                format_func=lambda i: f"{i['name']} ({i['email']})",
+                key="bulk_slots_interviewers",
+            )
+
+            if plan_mode == "Same slots for everyone":
+                interview_date, slots = slot_inputs("bulk_slots", clash_checker(selected_interviewers))
+
+                interviews = [
+                    scheduling.slot_interview(
+                        app_id,
+                        interview_type=interview_type,
+                        interviewer_ids=[i["id"] for i in selected_interviewers],
+                        meeting_link=meeting_link,
+                        location=location,
+                        interview_date=interview_date,
+                        slots=slots,
+                    )
+                    for app_id in picked
+                ]
+            else:
+                c1, c2 = st.columns(2)
+                first_day = c1.date_input("First Day", key="bulk_plan_day")
+                days = c2.number_input("Days", min_value=1, max_value=14, value=1, key="bulk_plan_days")
+
+                c1, c2 = st.columns(2)
+                day_start = c1.time_input("Available From", time(9, 0), key="bulk_plan_from")
+                day_end = c2.time_input("Available Until", time(17, 0), key="bulk_plan_until")
+
+                c1, c2 = st.columns(2)
+                minutes = c1.number_input(
+                    "Interview Length (minutes)",
+                    min_value=15,
+                    max_value=240,
+                    value=scheduling.INTERVIEW_MINUTES,
+                    step=15,
+                    key="bulk_plan_minutes",
+                )
+                per_candidate = c2.number_input(
+                    "Slots per Candidate", min_value=1, max_value=5, value=2, key="bulk_plan_slots"
+                )
+
+                # Each interviewer gets their own candidates, so interviewers'
+                # slots may overlap while no two candidates share one
+                windows = {
+                    i["id"]: [
+                        (
+                            datetime.combine(first_day + timedelta(days=d), day_start),
+                            datetime.combine(first_day + timedelta(days=d), day_end),
+                        )
+                        for d in range(int(days))
+                    ]
+                    for i in selected_interviewers
+                    if day_end > day_start
+                }
+                if not windows:
+                    # Nothing to plan against yet
+                    st.info("ℹ️ Choose interviewers and their available hours to see proposed slots.")
+                    plan, unplaced = {}, []
+                else:
+                    plan, unplaced = scheduling.propose_slots(
+                        picked,
+                        windows,
+                        minutes=int(minutes),
+                        per_candidate=int(per_candidate),
+                        busy=directory.get_busy_index(),
+                    )
+
+                interviewer_names = {i["id"]: i["name"] for i in selected_interviewers}
+                if plan:
+                    st.dataframe(
+                        pd.DataFrame([
+                            {
+                                "Candidate": names[app_id],
+                                "Interviewer": interviewer_names[interviewer_id],
+                                "Date": day,
+                                "Slots": ", ".join(f"{s['start_time']}–{s['end_time']}" for s in slots),
+                            }
+                            for app_id, (interviewer_id, day, slots) in plan.items()
+                        ]),
+                        hide_index=True,
+                    )
+                if unplaced:
+                    st.warning(
+                        f"⚠️ No free time left for {len(unplaced)} candidate(s). "
+                        "Add days or interviewers, or shorten the interviews."
+                    )
+
+                interviews = [
+                    scheduling.slot_interview(
+                        app_id,
+                        interview_type=interview_type,
+                        interviewer_ids=[interviewer_id],
+                        meeting_link=meeting_link,
+                        location=location,
+                        interview_date=day,
+                        slots=slots,
+                    )
+                    for app_id, (interviewer_id, day, slots) in plan.items()
+                ]
+
+            if st.button(
+                f"📤 Send Slots to {len(interviews)} Candidate(s)",
+                key="bulk_slots_send",
+                disabled=not (interviews and selected_interviewers),
+            ):
+                # Every candidate in one request
+                errors = scheduling.schedule_many(interviews, action=f"bulk_slots_{job_id}")
+
+                applicants.invalidate(job_id)
+                directory.invalidate_busy_index()
+                st.session_state.bulk_slots_result = (
+                    sum(1 for message in errors.values() if message is None),
+                    [(names[app_id], message) for app_id, message in errors.items() if message is not None],
+                )
+                st.session_state.reload_jobs = True
+                st.rerun()
+
+    bulk_slots([
+        app for app in applications
+        if app.get("status", "").lower() == "shortlisted" and not app.get("scheduled_at")
+    ])
+
+    # ==================================================
+    # BULK RESCHEDULE / CANCEL
+    # ==================================================
+    @api.fragment
+    def bulk_interviews():
+        # Shifts or cancels every scheduled interview of an interviewer or day
+        bulk_section = st.expander(
+            "🔁 Shift or Cancel Interviews in Bulk",
+            expanded=False,
+            key="bulk_interviews_section",
+            on_change="rerun",
+        )
+        with bulk_section:
+            bulk_result = st.session_state.pop("bulk_interviews_result", None)
+            if bulk_result:
+                done, failed = bulk_result
+                if done:
+                    st.success(f"✅ {done}")
+                    st.info("📩 Candidates and interviewers have been notified")
+                for name, message in failed:
+                    st.error(f"{name}: {message}")
+
+            # Candidates are only loaded while this section is open
+            if not bulk_section.open:
+                return
+
+            everyone = applicants.get_all_applicants(job_id)
+            if everyone is None:
+                st.error("Failed to load candidates")
+                return
+
+            scheduled = [app for app in everyone if app.get("scheduled_at")]
+            if not scheduled:
+                st.info("ℹ️ No scheduled interviews for this job.")
+                return
+
+            c1, c2 = st.columns(2)
+
+            # Interviewers are known only where the backend lists them on
+            # the application
+            interviewer_ids = {i for app in scheduled for i in app.get("interviewer_ids") or []}
+            interviewer = None
+            if interviewer_ids:
+                interviewer_names = {
+                    i["id"]: i["name"] for i in directory.get_interviewers() or []
+                }
+                interviewer = c1.selectbox(
+                    "Interviewer",
+                    [None, *sorted(interviewer_ids, key=lambda i: str(interviewer_names.get(i, i)))],
+                    format_func=lambda i: "All" if i is None else interviewer_names.get(i, f"Interviewer {i}"),
+                    key="bulk_interviews_interviewer",
+                )
+
+            times = {app["application_id"]: scheduling.parse_time(app["scheduled_at"]) for app in scheduled}
+            day = c2.selectbox(
+                "Date",
+                [None, *sorted({t.date() for t in times.values()})],
+                format_func=lambda d: "All" if d is None else d.strftime("%a %d %b %Y"),
+                key="bulk_interviews_day",
+            )
+
+            matched = [
+                app for app in scheduled
+                if (interviewer is None or interviewer in (app.get("interviewer_ids") or []))
+                and (day is None or times[app["application_id"]].date() == day)
+            ]
+            names = {app["application_id"]: app.get("candidate_name", "Unknown") for app in matched}
+
+            if not matched:
+                st.info("ℹ️ No scheduled interviews match.")
+                return
+
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Candidate": names[app["application_id"]],
+                        "Interview Time": times[app["application_id"]].strftime("%a %d %b %Y %H:%M"),
+                    }
+                    for app in sorted(matched, key=lambda app: times[app["application_id"]])
+                ]),
+                hide_index=True,
+            )
+
+            bulk_action = st.radio(
+                "Action",
+                ["Shift", "Cancel"],
+                horizontal=True,
+                key="bulk_interviews_action",
+            )
+
+            offset = timedelta()
+            if bulk_action == "Shift":
+                c1, c2 = st.columns(2)
+                offset_days = c1.number_input(
+                    "Shift by (days)", min_value=-30, max_value=30, value=0, key="bulk_interviews_days"
+                )
+                offset_minutes = c2.number_input(
+                    "Shift by (minutes)",
+                    min_value=-720,
+                    max_value=720,
+                    value=0,
+                    step=15,
+                    key="bulk_interviews_minutes",
+                )
+                offset = timedelta(days=int(offset_days), minutes=int(offset_minutes))
+            else:
+                st.warning(f"⚠️ {len(matched)} interview(s) will be cancelled")
+
+            if st.button(
+                f"{'⏩ Shift' if bulk_action == 'Shift' else '❌ Cancel'} {len(matched)} Interview(s)",
+                key="bulk_interviews_apply",
+                disabled=bulk_action == "Shift" and not offset,
+            ):
+                # Every interview in one request
+                if bulk_action == "Shift":
+                    errors = scheduling.shift_interviews(
+                        {app["application_id"]: app["scheduled_at"] for app in matched},
+                        offset,
+                        action=f"bulk_shift_{job_id}",
+                    )
+                    verb = "rescheduled"
+                else:
+                    errors = scheduling.cancel_interviews(names, action=f"bulk_cancel_{job_id}")
+                    verb = "cancelled"
+
+                applicants.invalidate(job_id)
+                directory.invalidate_busy_index()
+                done = sum(1 for message in errors.values() if message is None)
+                st.session_state.bulk_interviews_result = (
+                    f"{done} interview(s) {verb}" if done else None,
+                    [(names[app_id], message) for app_id, message in errors.items() if message is not None],
+                )
+                st.session_state.reload_jobs = True
+                st.rerun()
+
+    bulk_interviews()
 
     # ==================================================
     # CANDIDATE LOOP
     # ==================================================
-    for app in applications:
+    @api.fragment
+    def schedule_interview(app):
+        # Own fragment: opening it and filling it in reruns only this section
+        schedule_section = st.expander(
+            "📅 Schedule Interview",
+            expanded=False,
+            key=f"schedule_section_{app['application_id']}",
+            on_change="rerun",
+        )
+        with schedule_section:
+            # Nothing is built or loaded while this section is closed
+            if not schedule_section.open:
+                return
+
+            st.markdown("### Interview Scheduling")
+
+            interviewers = directory.get_interviewers()
+            if interviewers is None:
+                st.warning("⚠️ Could not load interviewers list")
+                interviewers = []
+
+            # ---------------- Interview Mode ----------------
+            schedule_mode = st.radio(
+                "Interview Scheduling Type",
+                ["Direct Interview (No Slots)", "Slot-based Interview"],
+                key=f"mode_{app['application_id']}"
+            )
+
+            # ---------------- Interview Type ----------------
+            interview_type = st.selectbox(
+                "Interview Type",
+                ["online", "offline", "telephone"],
+                key=f"type_{app['application_id']}"
+            )
+
+            meeting_link = None
+            location = None
+
+            if interview_type == "online":
+                meeting_link = st.text_input(
+                    "Meeting Link",
+                    placeholder="https://meet.google.com/abc-defg-hij",
+                    key=f"link_{app['application_id']}"
+                )
+            elif interview_type == "offline":
+                location = st.text_input(
+                    "Interview Location",
+                    placeholder="Office address or venue",
+                    key=f"loc_{app['application_id']}"
+                )
+            else:
+                st.info("ℹ️ Interview will be conducted via phone call")
+
+            # ---------------- Interviewers ----------------
+            st.markdown("### 👥 Select Interviewers")
+
+            if not interviewers:
+                st.warning("⚠️ No interviewers available. Please add interviewers first.")
+            else:
+                selected_interviewers = st.multiselect(
+                    "Choose Interviewers",
+                    options=interviewers,
+                    format_func=lambda i: f"{i['name']} ({i['email']})",
+                    key=f"interviewers_{app['application_id']}",
+                )
+
+                if not selected_interviewers:
+                    st.warning("⚠️ Please select at least one interviewer")
+
+                # ==================================================
+                # 🔹 DIRECT INTERVIEW
+                # ==================================================
+                if schedule_mode == "Direct Interview (No Slots)":
+                    st.markdown("### 🕐 Direct Interview Schedule")
+
+                    scheduled_at = st.datetime_input(
+                        "Interview Date & Time",
+                        key=f"direct_dt_{app['application_id']}"
+                    )
+
+                    clashes = clash_checker(selected_interviewers)
+                    if clashes is not None and scheduled_at is not None:
+                        busy_names = clashes(
+                            scheduled_at,
+                            scheduled_at + timedelta(minutes=scheduling.INTERVIEW_MINUTES),
+                        )
+                        if busy_names:
+                            st.warning(f"⚠️ Clashes with interviews of {', '.join(busy_names)}")
+
+                    if st.button(
+                        "📤 Send Direct Interview Link",
+                        key=f"send_direct_{app['application_id']}",
+                        disabled=not selected_interviewers
+                    ):
+                        res = api.post(
+                            "/interviews/schedule",
+                            idempotent=f"schedule_{app['application_id']}",
+                            json={
+                                "application_id": app["application_id"],
+                                "schedule_mode": "direct",
+                                "interview_type": interview_type,
+                                "scheduled_at": scheduled_at.isoformat(),
+                                "interviewer_ids": [i["id"] for i in selected_interviewers],
+                                "meeting_link": meeting_link,
+                                "location": location,
+                            },
+                        )
+
+                        if res.status_code == 200:
+                            applicants.invalidate(job_id)
+                            directory.invalidate_busy_index()
+                            st.success("✅ Interview link sent successfully")
+                            st.info("📩 Emails & calendar invites sent to candidate and interviewers")
+                            st.rerun()
+                        else:
+                            st.error(res.text)
+
+                # ==================================================
+                # 🔹 SLOT-BASED INTERVIEW
+                # ==================================================
+                else:
+                    st.markdown("### 🗓️ Slot-based Interview Schedule")
+
+                    interview_date, slots = slot_inputs(
+                        app["application_id"], clash_checker(selected_interviewers)
+                    )
+
+                    if st.button(
+                        "📤 Send Interview Slots",
+                        key=f"send_slots_{app['application_id']}",
+                        disabled=not selected_interviewers
+                    ):
+                        # Interview and slots in one call: both are created or neither
+                        error = scheduling.schedule_with_slots(
+                            scheduling.slot_interview(
+                                app["application_id"],
+                                interview_type=interview_type,
+                                interviewer_ids=[i["id"] for i in selected_interviewers],
+                                meeting_link=meeting_link,
+                                location=location,
+                                interview_date=interview_date,
+                                slots=slots,
+                            )
+                        )
+
+                        if error is None:
+                            applicants.invalidate(job_id)
+                            directory.invalidate_busy_index()
+                            st.success("✅ Interview slots sent successfully")
+                            st.info("📩 Candidate has been notified to select a slot")
+                            st.session_state.reload_jobs = True
+                            st.rerun()
+                        else:
+                            st.error(error)
+
+    @api.fragment
+    def applicant_card(app):
+        # Own fragment: widgets here rerun only this candidate. Saves are
+        # shown from the local change store instead of refetching the list.
+        app = applicants.merged(app)
         with st.container():
             col1, col2, col3 = st.columns([4, 3, 4])
 
@@ -659,6 +1468,7 @@ with tab2:
                 status = app.get("status", "applied").lower()
                 icon = STATUS_ICONS.get(status, "⚪")
 
+                st.checkbox("Select", key=f"bulk_{app['application_id']}")
                 st.markdown(f"**{icon} {app.get('candidate_name', 'Unknown')}**")
                 st.write(f"📧 {app.get('candidate_email', '-')}")
                 st.write(f"📞 {app.get('candidate_phone') or 'Not provided'}")
@@ -684,14 +1494,6 @@ with tab2:
             # ---------------- Assignment + Status ----------------
             with col3:
 
-                my_recruiter_id = st.session_state.get("recruiter_id")
-
-                assignable_recruiters = {
-                    name: rid
-                    for name, rid in recruiter_map.items()
-                    if rid != my_recruiter_id
-                }
-
                 if assignable_recruiters:
                     selected_recruiter = st.selectbox(
                         "Assign Recruiter",
@@ -700,22 +1502,28 @@ with tab2:
                     )
 
                     if st.button("✅ Assign", key=f"assign_btn_{app['application_id']}"):
-                        res = requests.post(
-                            f"{API_BASE}/admin/assign-applications",
-                            headers=auth_headers(),
+                        local = applicants.change(
+                            app["application_id"], assigned_recruiter_name=selected_recruiter
+                        )
+                        res = api.post(
+                            "/admin/assign-applications",
                             json={
                                 "job_id": job_id,
                                 "assignments": [{
                                     "application_id": app["application_id"],
                                     "recruiter_id": assignable_recruiters[selected_recruiter]
                                 }]
-                            }
+                            },
+                            idempotent=f"assign_{app['application_id']}",
                         )
 
                         if res.status_code == 200:
+                            local.confirm(res)
+                            applicants.invalidate(job_id)
                             st.success("Recruiter assigned successfully")
-                            st.rerun()
+                            rerun_fragment()
                         else:
+                            local.rollback()
                             st.error(res.text)
 
 
@@ -734,16 +1542,19 @@ with tab2:
                 )
 
                 if st.button("💾 Save Status", key=f"save_{app['application_id']}"):
-                    res = requests.put(
-                        f"{API_BASE}/applications/{app['application_id']}/status",
-                        headers=auth_headers(),
+                    local = applicants.change(app["application_id"], status=new_status)
+                    res = api.put(
+                        f"/applications/{app['application_id']}/status",
                         params={"status": new_status},
                     )
 
                     if res.status_code == 200:
+                        local.confirm(res)
+                        applicants.invalidate(job_id)
                         st.success("✅ Status updated successfully")
-                        st.rerun()
+                        rerun_fragment()
                     else:
+                        local.rollback()
                         st.error(res.text)
 
             st.divider()
@@ -753,172 +1564,7 @@ with tab2:
             # INTERVIEW SCHEDULING (ONLY IF SHORTLISTED)
             # ==================================================
             if current_status == "shortlisted":
-                with st.expander("📅 Schedule Interview", expanded=False):
-                    st.markdown("### Interview Scheduling")
-
-                    # ---------------- Interview Mode ----------------
-                    schedule_mode = st.radio(
-                        "Interview Scheduling Type",
-                        ["Direct Interview (No Slots)", "Slot-based Interview"],
-                        key=f"mode_{app['application_id']}"
-                    )
-
-                    # ---------------- Interview Type ----------------
-                    interview_type = st.selectbox(
-                        "Interview Type",
-                        ["online", "offline", "telephone"],
-                        key=f"type_{app['application_id']}"
-                    )
-
-                    meeting_link = None
-                    location = None
-
-                    if interview_type == "online":
-                        meeting_link = st.text_input(
-                            "Meeting Link",
-                            placeholder="https://meet.google.com/abc-defg-hij",
-                            key=f"link_{app['application_id']}"
-                        )
-                    elif interview_type == "offline":
-                        location = st.text_input(
-                            "Interview Location",
-                            placeholder="Office address or venue",
-                            key=f"loc_{app['application_id']}"
-                        )
-                    else:
-                        st.info("ℹ️ Interview will be conducted via phone call")
-
-                    # ---------------- Interviewers ----------------
-                    st.markdown("### 👥 Select Interviewers")
-
-                    if not INTERVIEWERS:
-                        st.warning("⚠️ No interviewers available. Please add interviewers first.")
-                    else:
-                        selected_interviewers = st.multiselect(
-                            "Choose Interviewers",
-                            options=INTERVIEWERS,
-                            format_func=lambda i: f"{i['name']} ({i['email']})",
-                            key=f"interviewers_{app['application_id']}",
-                        )
-
-                        if not selected_interviewers:
-                            st.warning("⚠️ Please select at least one interviewer")
-
-                        # ==================================================
-                        # 🔹 DIRECT INTERVIEW
-                        # ==================================================
-                        if schedule_mode == "Direct Interview (No Slots)":
-                            st.markdown("### 🕐 Direct Interview Schedule")
-
-                            scheduled_at = st.datetime_input(
-                                "Interview Date & Time",
-                                key=f"direct_dt_{app['application_id']}"
-                            )
-
-                            if st.button(
-                                "📤 Send Direct Interview Link",
-                                key=f"send_direct_{app['application_id']}",
-                                disabled=not selected_interviewers
-                            ):
-                                res = requests.post(
-                                    f"{API_BASE}/interviews/schedule",
-                                    headers=auth_headers(),
-                                    json={
-                                        "application_id": app["application_id"],
-                                        "schedule_mode": "direct",
-                                        "interview_type": interview_type,
-                                        "scheduled_at": scheduled_at.isoformat(),
-                                        "interviewer_ids": [i["id"] for i in selected_interviewers],
-                                        "meeting_link": meeting_link,
-                                        "location": location,
-                                    },
-                                )
-
-                                if res.status_code == 200:
-                                    st.success("✅ Interview link sent successfully")
-                                    st.info("📩 Emails & calendar invites sent to candidate and interviewers")
-                                    st.rerun()
-                                else:
-                                    st.error(res.text)
-
-                        # ==================================================
-                        # 🔹 SLOT-BASED INTERVIEW
-                        # ==================================================
-                        else:
-                            st.markdown("### 🗓️ Slot-based Interview Schedule")
-
-                            interview_date = st.date_input(
-                                "Interview Date",
-                                key=f"date_{app['application_id']}",
-                            )
-
-                            st.markdown("### ⏱ Available Time Slots")
-
-                            slot_count = st.number_input(
-                                "Number of Slots",
-                                min_value=1,
-                                max_value=5,
-                                value=2,
-                                key=f"slot_count_{app['application_id']}",
-                            )
-
-                            slots = []
-
-                            for i in range(int(slot_count)):
-                                c1, c2 = st.columns(2)
-                                with c1:
-                                    start = st.time_input(
-                                        f"Slot {i+1} Start",
-                                        key=f"start_{app['application_id']}_{i}",
-                                    )
-                                with c2:
-                                    end = st.time_input(
-                                        f"Slot {i+1} End",
-                                        key=f"end_{app['application_id']}_{i}",
-                                    )
-
-                                slots.append({
-                                    "start_time": start.strftime("%H:%M"),
-                                    "end_time": end.strftime("%H:%M"),
-                                })
-
-                            if st.button(
-                                "📤 Send Interview Slots",
-                                key=f"send_slots_{app['application_id']}",
-                                disabled=not selected_interviewers
-                            ):
-                                interview_res = requests.post(
-                                    f"{API_BASE}/interviews/schedule",
-                                    headers=auth_headers(),
-                                    json={
-                                        "application_id": app["application_id"],
-                                        "schedule_mode": "slots",
-                                        "interview_type": interview_type,
-                                        "interviewer_ids": [i["id"] for i in selected_interviewers],
-                                        "meeting_link": meeting_link,
-                                        "location": location,
-                                    },
-                                )
-
-                                if interview_res.status_code != 200:
-                                    st.error(interview_res.text)
-                                else:
-                                    interview_id = interview_res.json()["interview_id"]
-
-                                    slot_res = requests.post(
-                                        f"{API_BASE}/interviews/slots/{interview_id}",
-                                        headers=auth_headers(),
-                                        params={"interview_date": str(interview_date)},
-                                        json=slots,
-                                    )
-
-                                    if slot_res.status_code == 200:
-                                        st.success("✅ Interview slots sent successfully")
-                                        st.info("📩 Candidate has been notified to select a slot")
-                                        st.session_state.reload_jobs = True
-                                        st.rerun()
-                                    else:
-                                        st.error(slot_res.text)
+                schedule_interview(app)
 
             # ==================================================
             # INTERVIEW MANAGEMENT (AFTER SCHEDULED)
@@ -941,20 +1587,26 @@ with tab2:
                             "🔄 Reschedule Interview",
                             key=f"reschedule_btn_{app['application_id']}"
                         ):
-                            res = requests.put(
-                                f"{API_BASE}/interviews/reschedule/{app['application_id']}",
-                                headers=auth_headers(),
+                            local = applicants.change(
+                                app["application_id"], scheduled_at=new_datetime.isoformat()
+                            )
+                            res = api.put(
+                                f"/interviews/reschedule/{app['application_id']}",
                                 params={
                                     "new_scheduled_at": new_datetime.isoformat()
                                 }
                             )
 
                             if res.status_code == 200:
+                                local.confirm(res)
+                                applicants.invalidate(job_id)
+                                directory.invalidate_busy_index()
                                 st.success("✅ Interview rescheduled successfully")
                                 st.info("📩 Candidate and interviewers have been notified")
                                 st.session_state.reload_jobs = True
-                                st.rerun()
+                                rerun_fragment()
                             else:
+                                local.rollback()
                                 st.error(res.text)
 
                     with col_r2:
@@ -962,15 +1614,20 @@ with tab2:
                             "❌ Cancel Interview",
                             key=f"cancel_btn_{app['application_id']}"
                         ):
-                            res = requests.put(
-                                f"{API_BASE}/interviews/cancel/{app['application_id']}",
-                                headers=auth_headers(),
-                            )
+                            local = applicants.change(app["application_id"], scheduled_at=None)
+                            res = api.put(f"/interviews/cancel/{app['application_id']}")
 
                             if res.status_code == 200:
+                                local.confirm(res)
+                                applicants.invalidate(job_id)
+                                directory.invalidate_busy_index()
                                 st.success("❌ Interview cancelled successfully")
-                                st.rerun()
+                                rerun_fragment()
                             else:
+                                local.rollback()
                                 st.error(res.text)
 
             st.markdown("---")
+
+    for app in applications:
+        applicant_card(app)
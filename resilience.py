@@ -0,0 +1,156 @@
+import json
+import random
+import threading
+import time
+from http import HTTPStatus
+
+import requests
+
+
+# -------------------------------
+# ENDPOINT GROUPS
+# -------------------------------
+def endpoint_group(path: str) -> str:
+    """
+    Returns the breaker group of an API path: its first segment.
+    "/jobs/12/unarchive" -> "jobs"
+    """
+    segment = path.lstrip("/").split("?", 1)[0].split("/", 1)[0]
+    return segment or "root"
+
+
+# -------------------------------
+# CIRCUIT BREAKER
+# -------------------------------
+class CircuitBreaker:
+    """
+    Client-side circuit breaker for one endpoint group.
+
+    closed    -> calls go through; consecutive failures are counted.
+    open      -> calls fail fast until reset_after seconds have passed.
+    half_open -> one probe call is let through; its outcome closes or
+                 re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_after: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_after:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Returns True if a call may be sent now.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def release(self):
+        """
+        Ends a call without counting its outcome, e.g. one the caller cut
+        short. Frees the probe slot if the call was the half-open probe.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised instead of sending a call while its circuit is open.
+    """
+
+
+def is_failure(response) -> bool:
+    """
+    Returns True if a response means the backend itself is unhealthy.
+    """
+    return response.status_code >= 500
+
+
+def unavailable_response(url: str, reason: str, status_code: int = 503):
+    """
+    Builds a 503 (or status_code) response for a call that could not reach
+    the backend. Pages handle it like any other failed call.
+    """
+    res = requests.Response()
+    res.status_code = status_code
+    res.reason = HTTPStatus(status_code).phrase
+    res.url = url
+    res.headers["Content-Type"] = "application/json"
+    res._content = json.dumps({"detail": reason}).encode()
+    res.encoding = "utf-8"
+    return res
+
+
+# -------------------------------
+# RETRIES
+# -------------------------------
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+    Attempt n (from 0) waits a random time in [0, min(cap, base * 2**n)].
+    """
+
+    def __init__(self, attempts: int = 3, base: float = 0.25, cap: float = 4.0):
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+
+    def delay(self, attempt: int, response=None) -> float:
+        """
+        Returns the seconds to wait before retrying after attempt.
+        A Retry-After header is honoured, up to cap.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.cap, float(retry_after))
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+
+def is_retryable(response) -> bool:
+    """
+    Returns True if a failed call may succeed when sent again.
+    """
+    return response.status_code in RETRYABLE_STATUSES
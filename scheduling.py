@@ -0,0 +1,305 @@
+import bisect
+import heapq
+import os
+from datetime import datetime, timedelta
+
+import api
+import applicants
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+# Minutes a direct interview is assumed to last when checking for clashes.
+INTERVIEW_MINUTES = int(os.getenv("INTERVIEW_MINUTES", "60"))
+
+
+# -------------------------------
+# SLOT-BASED INTERVIEWS
+# -------------------------------
+SCHEDULE_WITH_SLOTS_PATH = "/interviews/schedule-with-slots"
+BULK_SCHEDULE_PATH = "/interviews/bulk-schedule"
+
+
+def slot_interview(
+    application_id,
+    *,
+    interview_type,
+    interviewer_ids,
+    meeting_link,
+    location,
+    interview_date,
+    slots,
+) -> dict:
+    """
+    Builds one slot-based interview request: the interview and the slots
+    the candidate can pick from ([{start_time, end_time}] on interview_date).
+    """
+    return {
+        "application_id": application_id,
+        "schedule_mode": "slots",
+        "interview_type": interview_type,
+        "interviewer_ids": interviewer_ids,
+        "meeting_link": meeting_link,
+        "location": location,
+        "interview_date": str(interview_date),
+        "slots": slots,
+    }
+
+
+def schedule_with_slots(interview: dict):
+    """
+    Creates a slot-based interview together with its slots.
+    Returns None on success, else the error message.
+
+    Uses POST /interviews/schedule-with-slots, which creates both or
+    neither. Without it, makes the two calls and cancels the interview
+    again if its slots could not be added.
+    """
+    if api.supports(SCHEDULE_WITH_SLOTS_PATH):
+        res = api.post(
+            SCHEDULE_WITH_SLOTS_PATH,
+            json=interview,
+            idempotent=f"schedule_{interview['application_id']}",
+        )
+
+        if not api.route_missing(SCHEDULE_WITH_SLOTS_PATH, res):
+            return None if res.status_code in (200, 201) else res.text
+
+    return _schedule_in_two_calls(interview)
+
+
+def _schedule_in_two_calls(interview: dict):
+    app_id = interview["application_id"]
+    fields = {k: v for k, v in interview.items() if k not in ("interview_date", "slots")}
+
+    res = api.post("/interviews/schedule", json=fields, idempotent=f"schedule_{app_id}")
+    if res.status_code != 200:
+        return res.text
+
+    interview_id = res.json()["interview_id"]
+    slot_res = api.post(
+        f"/interviews/slots/{interview_id}",
+        params={"interview_date": interview["interview_date"]},
+        idempotent=f"slots_{interview_id}",
+        json=interview["slots"],
+    )
+    if slot_res.status_code == 200:
+        return None
+
+    # Do not leave an interview the candidate cannot pick a slot for
+    api.put(f"/interviews/cancel/{app_id}")
+    return slot_res.text
+
+
+def schedule_many(interviews: list, *, action: str) -> dict:
+    """
+    Sends several slot-based interviews (see slot_interview) in one
+    POST /interviews/bulk-schedule. Returns application_id -> error
+    message, with None for the ones that were scheduled.
+
+    Without the bulk endpoint, schedules them one at a time: scheduling
+    is not idempotent, so each call needs its Idempotency-Key, and those
+    live in the session (not reachable from worker threads).
+    """
+    if api.supports(BULK_SCHEDULE_PATH):
+        res = api.post(BULK_SCHEDULE_PATH, json={"interviews": interviews}, idempotent=action)
+
+        if not api.route_missing(BULK_SCHEDULE_PATH, res):
+            return api.bulk_results(res, [i["application_id"] for i in interviews])
+
+    return {i["application_id"]: schedule_with_slots(i) for i in interviews}
+
+
+# -------------------------------
+# INTERVIEWER BUSY TIME
+# -------------------------------
+def parse_time(value) -> datetime:
+    """
+    Parses an ISO timestamp from the backend as naive local time, the
+    way Streamlit's date and time inputs return it.
+    """
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
+
+
+class BusyIndex:
+    """
+    Busy time of each interviewer as sorted, disjoint intervals, so
+    checking a new interview for clashes is one binary search per
+    interviewer. Shared between sessions; treat it as read-only.
+    """
+
+    def __init__(self, intervals):
+        """
+        intervals: (interviewer_id, start, end) datetimes, in any order.
+        """
+        spans_by_interviewer = {}
+        for interviewer_id, start, end in intervals:
+            spans_by_interviewer.setdefault(interviewer_id, []).append((start, end))
+
+        self._starts = {}
+        self._ends = {}
+        for interviewer_id, spans in spans_by_interviewer.items():
+            spans.sort()
+            merged = []
+            for start, end in spans:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self._starts[interviewer_id] = [start for start, _ in merged]
+            self._ends[interviewer_id] = [end for _, end in merged]
+
+    def is_busy(self, interviewer_id, start: datetime, end: datetime) -> bool:
+        """
+        Whether [start, end) overlaps any of the interviewer's busy time.
+        """
+        starts = self._starts.get(interviewer_id)
+        if not starts:
+            return False
+        # The last busy interval starting before end is the only candidate:
+        # intervals are disjoint, so it also ends last.
+        i = bisect.bisect_left(starts, end) - 1
+        return i >= 0 and self._ends[interviewer_id][i] > start
+
+    def clashes(self, interviewer_ids, start: datetime, end: datetime) -> list:
+        """
+        Returns the interviewer_ids already busy at some point in [start, end).
+        """
+        return [i for i in interviewer_ids if self.is_busy(i, start, end)]
+
+
+# -------------------------------
+# SLOT PROPOSALS
+# -------------------------------
+def propose_slots(application_ids, windows: dict, *, minutes: int, per_candidate: int, busy=None):
+    """
+    Proposes interview slots for many candidates at once.
+
+    windows maps interviewer_id -> [(start, end)] datetimes when the
+    interviewer is available. They are cut into interviews of minutes,
+    skipping times busy (a BusyIndex) already has taken. Each candidate
+    gets up to per_candidate of them, all with one interviewer on one day
+    (an interview has a single date), and no time is offered to two
+    candidates. Candidates go to the interviewer-day with the most free
+    slots left, which spreads them evenly.
+
+    Returns (plan, unplaced): plan maps application_id ->
+    (interviewer_id, date, [{start_time, end_time}]); unplaced lists the
+    candidates there was no free time left for.
+    """
+    length = timedelta(minutes=minutes)
+
+    free = {}
+    for interviewer_id, spans in windows.items():
+        for start, end in spans:
+            t = start
+            while t + length <= end:
+                if busy is None or not busy.is_busy(interviewer_id, t, t + length):
+                    free.setdefault((interviewer_id, t.date()), []).append(t)
+                t += length
+    for times in free.values():
+        times.sort(reverse=True)
+
+    # Most free slots first; the insertion order breaks ties
+    heap = [(-len(times), order, key) for order, (key, times) in enumerate(free.items())]
+    heapq.heapify(heap)
+
+    plan = {}
+    unplaced = []
+    for app_id in application_ids:
+        if not heap:
+            unplaced.append(app_id)
+            continue
+
+        _, order, key = heapq.heappop(heap)
+        times = free[key]
+        taken = [times.pop() for _ in range(min(per_candidate, len(times)))]
+        if times:
+            heapq.heappush(heap, (-len(times), order, key))
+
+        interviewer_id, day = key
+        plan[app_id] = (
+            interviewer_id,
+            day,
+            [
+                {"start_time": t.strftime("%H:%M"), "end_time": (t + length).strftime("%H:%M")}
+                for t in taken
+            ],
+        )
+    return plan, unplaced
+
+
+# -------------------------------
+# BULK RESCHEDULE / CANCEL
+# -------------------------------
+BULK_UPDATE_PATH = "/interviews/bulk-update"
+
+
+def shift_interviews(scheduled: dict, offset: timedelta, *, action: str) -> dict:
+    """
+    Moves several interviews by offset (negative to bring them forward).
+    scheduled maps application_id -> its scheduled_at as the backend sent
+    it; new times keep its UTC offset, if any.
+    Returns application_id -> error message, with None for the ones moved.
+
+    Uses one POST /interviews/bulk-update; without it, sends one
+    PUT /interviews/reschedule/{id} per interview, concurrently.
+    New times are shown at once and rolled back where the move failed.
+    """
+    moved = {
+        app_id: (datetime.fromisoformat(scheduled_at) + offset).isoformat()
+        for app_id, scheduled_at in scheduled.items()
+    }
+    return _bulk_update(
+        {"action": "shift", "offset_minutes": int(offset.total_seconds() // 60)},
+        {
+            app_id: (f"/interviews/reschedule/{app_id}", {"new_scheduled_at": new_time})
+            for app_id, new_time in moved.items()
+        },
+        action,
+        {app_id: applicants.change(app_id, scheduled_at=new_time) for app_id, new_time in moved.items()},
+    )
+
+
+def cancel_interviews(application_ids, *, action: str) -> dict:
+    """
+    Cancels several interviews. Returns application_id -> error message,
+    with None for the ones cancelled. Same endpoints as shift_interviews,
+    falling back to PUT /interviews/cancel/{id}.
+    """
+    application_ids = list(application_ids)
+    return _bulk_update(
+        {"action": "cancel"},
+        {app_id: (f"/interviews/cancel/{app_id}", None) for app_id in application_ids},
+        action,
+        {app_id: applicants.change(app_id, scheduled_at=None) for app_id in application_ids},
+    )
+
+
+def _bulk_update(body: dict, fallback: dict, action: str, local: dict) -> dict:
+    """
+    fallback maps application_id -> (path, params) of its own PUT;
+    local maps it to its LocalChange, rolled back if it failed.
+    """
+    results = _send_update(body, fallback, action)
+    for app_id, message in results.items():
+        if message is not None:
+            local[app_id].rollback()
+    return results
+
+
+def _send_update(body: dict, fallback: dict, action: str) -> dict:
+    if api.supports(BULK_UPDATE_PATH):
+        res = api.post(
+            BULK_UPDATE_PATH,
+            json={**body, "application_ids": list(fallback)},
+            idempotent=action,
+        )
+
+        if not api.route_missing(BULK_UPDATE_PATH, res):
+            return api.bulk_results(res, fallback)
+
+    return api.put_each(fallback)
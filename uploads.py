@@ -0,0 +1,128 @@
+import os
+
+import requests
+
+import api
+from auth import auth_headers
+
+# -------------------------------
+# CONFIG
+# -------------------------------
+# Seconds allowed for streaming one file to object storage.
+UPLOAD_TIMEOUT = float(os.getenv("API_UPLOAD_TIMEOUT", "120"))
+
+
+# -------------------------------
+# JOB DESCRIPTION FILES
+# -------------------------------
+PRESIGN_PATH = "/job-descriptions/presign"
+FILES_PATH = "/job-descriptions/files"
+
+
+def start_upload(file):
+    """
+    Starts streaming an uploaded file (st.file_uploader) to object
+    storage in the background, so it can overlap with creating the job.
+    Returns a Future for attach(), or None when the backend cannot
+    presign uploads.
+
+    The backend answers POST /job-descriptions/presign with
+    {"url", "key", "headers"}: a presigned PUT URL (S3, or MinIO / moto
+    when run locally), the object key, and headers the PUT must carry.
+    """
+    if not api.supports(PRESIGN_PATH):
+        return None
+
+    # Worker threads have no Streamlit session, so resolve auth here.
+    headers = dict(auth_headers())
+    return api.get_executor().submit(_upload, file, headers, api.current_run())
+
+
+def _upload(file, headers, run):
+    """
+    Returns (file_key, error, True if the backend has no presign endpoint).
+    """
+    res = api.post(
+        PRESIGN_PATH,
+        auth=False,
+        headers=headers,
+        _run=run,
+        json={"filename": file.name, "content_type": file.type, "size": file.size},
+    )
+    if res.status_code != 200:
+        return None, res.text, api.route_missing(PRESIGN_PATH, res)
+
+    try:
+        target = res.json()
+        url, key = target["url"], target["key"]
+    except (ValueError, KeyError, TypeError):
+        return None, f"Unexpected presign reply: {res.text[:200]}", False
+
+    file.seek(0)
+    try:
+        # A file object is sent in blocks with its Content-Length,
+        # never copied into one bytes object.
+        put = api.get_session().put(
+            url,
+            data=file,
+            headers=target.get("headers") or {},
+            timeout=UPLOAD_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        return None, str(e), False
+
+    if not put.ok:
+        return None, put.text, False
+    return key, None, False
+
+
+def attach(job_id, upload, file):
+    """
+    Links a job description file to a created job. Returns None on
+    success, else the error message.
+
+    upload is what start_upload returned. Once the file is in storage its
+    key is set with PATCH /jobs/{job_id}. Without presigned uploads the
+    file goes through POST /job-descriptions/upload instead.
+    """
+    if upload is not None:
+        file_key, error, missing = upload.result()
+
+        if not missing:
+            if error is not None:
+                return error
+            res = api.patch(f"/jobs/{job_id}", json={"description_file_key": file_key})
+            if res.status_code == 200:
+                return None
+            discard(upload)
+            return res.text
+
+    file.seek(0)
+    res = api.post(
+        "/job-descriptions/upload",
+        params={"job_id": job_id},
+        files={"file": (file.name, file, file.type)},
+        timeout=30,
+    )
+    return None if res.status_code == 200 else res.text
+
+
+def discard(upload):
+    """
+    Gives up an upload whose job was not created (or not linked to it):
+    cancels it if it has not started, else deletes the stored file with
+    DELETE /job-descriptions/files?key=... once the upload is done.
+    Returns at once; the delete runs in the background.
+    """
+    if upload is None or upload.cancel():
+        return
+
+    # Worker threads have no Streamlit session, so resolve auth here.
+    headers = dict(auth_headers())
+    upload.add_done_callback(lambda done: _delete(done, headers))
+
+
+def _delete(upload, headers):
+    file_key, _error, _missing = upload.result()
+    if file_key is not None:
+        api.delete(FILES_PATH, auth=False, headers=headers, params={"key": file_key})